@@ -71,6 +71,21 @@ class AgentRegistry:
 
         cls._agents[norm] = AgentRegistration(name=norm, factory=actual_factory, meta=meta or {})
 
+    @classmethod
+    def snapshot(cls) -> Dict[str, AgentRegistration]:
+        """
+        Copy of the current registrations, for a later restore().
+        """
+        return dict(cls._agents)
+
+    @classmethod
+    def restore(cls, registrations: Dict[str, AgentRegistration]) -> None:
+        """
+        Replace every registration with a snapshot; missing core agents re-register lazily.
+        """
+        cls.clear()
+        cls._agents.update(registrations)
+
     @classmethod
     def resolve(cls, name: str) -> BaseAgent:
         _register_core_agents()
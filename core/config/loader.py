@@ -33,6 +33,8 @@ from __future__ import annotations
 
 
 
+import copy
+import functools
 import os
 import logging
 from pathlib import Path
@@ -211,6 +213,98 @@ def _is_hf_space_env(env: Dict[str, str]) -> bool:
     return "HF_HOME" in env or "SPACE_ID" in env
 
 
+# ==============================
+# Settings Cache
+# ==============================
+
+
+_CONFIG_FILES: Tuple[str, ...] = ("app.yaml", "models.yaml", "policies.yaml", "logging.yaml", "products.yaml")
+_ENV_PREFIX = "MASTER__"
+_CACHE_ENV_KEYS = frozenset(
+    {"OPENAI_API_KEY", "OPENAI_API_KEY_REF", "OPENAI_ORG_ID", "OPENAI_ORG_ID_REF", "HF_HOME", "SPACE_ID"}
+)
+
+
+def _env_cache_key(env: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted((k, v) for k, v in env.items() if k.startswith(_ENV_PREFIX) or k in _CACHE_ENV_KEYS))
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _load_validated(
+    cfg_dir_str: str,
+    sec_path_str: str,
+    root_str: str,
+    env_items: Tuple[Tuple[str, str], ...],
+    stamps: Tuple[Optional[Tuple[int, int]], ...],
+) -> Tuple[Settings, Dict[str, Any]]:
+    """
+    Read, merge and validate configs for one hashable view of the inputs.
+
+    `stamps` (mtime_ns, size per source file) is only part of the cache key: editing a
+    config or secrets file yields a fresh entry instead of a stale one.
+    """
+    cfg_dir = Path(cfg_dir_str)
+    effective_env = dict(env_items)
+
+    # --- Load base config YAML files ---
+    app_cfg = _read_yaml(cfg_dir / "app.yaml")
+    models_cfg = _read_yaml(cfg_dir / "models.yaml")
+    policies_cfg = _read_yaml(cfg_dir / "policies.yaml")
+    logging_cfg = _read_yaml(cfg_dir / "logging.yaml")
+    products_cfg = _read_yaml(cfg_dir / "products.yaml")
+
+    merged: Dict[str, Any] = {}
+    merged = _deep_merge(merged, {"app": _normalize_app_config(_section(app_cfg, "app"))})
+    merged = _deep_merge(merged, {"models": _section(models_cfg, "models")})
+    merged = _deep_merge(merged, {"policies": _section(policies_cfg, "policies")})
+    merged = _deep_merge(merged, {"logging": _section(logging_cfg, "logging")})
+    merged = _deep_merge(merged, {"products": _section(products_cfg, "products")})
+
+    # --- Load secrets.yaml (optional) ---
+    secrets_cfg = _read_yaml(Path(sec_path_str))
+    merged = _deep_merge(merged, {"secrets": _section(secrets_cfg, "secrets")})
+
+    if _is_hf_space_env(effective_env):
+        # Hugging Face Spaces has an ephemeral filesystem; default to /data for persistence when unset.
+        paths_cfg = (merged.get("app") or {}).get("paths") if isinstance(merged.get("app"), dict) else None
+        storage_dir = paths_cfg.get("storage_dir") if isinstance(paths_cfg, dict) else None
+        observability_dir = paths_cfg.get("observability_dir") if isinstance(paths_cfg, dict) else None
+        if not storage_dir:
+            merged = _deep_merge(merged, {"app": {"paths": {"storage_dir": "/data/storage"}}})
+        if not observability_dir:
+            merged = _deep_merge(merged, {"app": {"paths": {"observability_dir": "/data/observability"}}})
+
+    # --- Apply MASTER__ env var overrides ---
+    merged = _apply_env_overrides(merged, effective_env)
+
+    # --- Resolve provider secret refs (non-MASTER env vars) ---
+    merged = _hydrate_provider_refs(merged, effective_env)
+
+    # --- Inject repo_root path to ensure deterministic path ---
+    merged = _deep_merge(merged, {"app": {"paths": {"repo_root": root_str}}})
+
+    # --- Validate merged config against pydantic schema ---
+    try:
+        settings = Settings.model_validate(merged)
+    except ValidationError as e:
+        # raise with helpful context for debugging
+        raise ValueError(f"Invalid configuration: {e}") from e
+
+    # --- Hydrate provider secrets after validation ---
+    # This happens after validation to avoid breaking precedence rules
+    # and to ensure the final Settings object has secrets injected appropriately.
+    settings = _hydrate_provider_secrets(settings)
+    return settings, merged
+
+
 # ==============================
 # Public Loader API
 # ==============================
@@ -271,56 +365,21 @@ Inputs:
                 effective_env.setdefault(k, v)
 
     cfg_dir = root / (configs_dir or "configs")
-
-    # --- Load base config YAML files ---
-    app_cfg = _read_yaml(cfg_dir / "app.yaml")
-    models_cfg = _read_yaml(cfg_dir / "models.yaml")
-    policies_cfg = _read_yaml(cfg_dir / "policies.yaml")
-    logging_cfg = _read_yaml(cfg_dir / "logging.yaml")
-    products_cfg = _read_yaml(cfg_dir / "products.yaml")
-
-    merged: Dict[str, Any] = {}
-    merged = _deep_merge(merged, {"app": _normalize_app_config(_section(app_cfg, "app"))})
-    merged = _deep_merge(merged, {"models": _section(models_cfg, "models")})
-    merged = _deep_merge(merged, {"policies": _section(policies_cfg, "policies")})
-    merged = _deep_merge(merged, {"logging": _section(logging_cfg, "logging")})
-    merged = _deep_merge(merged, {"products": _section(products_cfg, "products")})
-
-    # --- Load secrets.yaml (optional) ---
     sec_path = Path(secrets_file or secrets_path) if (secrets_file or secrets_path) else (root / "secrets" / "secrets.yaml")
-    secrets_cfg = _read_yaml(sec_path)
-    merged = _deep_merge(merged, {"secrets": _section(secrets_cfg, "secrets")})
-
-    if _is_hf_space_env(effective_env):
-        # Hugging Face Spaces has an ephemeral filesystem; default to /data for persistence when unset.
-        paths_cfg = (merged.get("app") or {}).get("paths") if isinstance(merged.get("app"), dict) else None
-        storage_dir = paths_cfg.get("storage_dir") if isinstance(paths_cfg, dict) else None
-        observability_dir = paths_cfg.get("observability_dir") if isinstance(paths_cfg, dict) else None
-        if not storage_dir:
-            merged = _deep_merge(merged, {"app": {"paths": {"storage_dir": "/data/storage"}}})
-        if not observability_dir:
-            merged = _deep_merge(merged, {"app": {"paths": {"observability_dir": "/data/observability"}}})
-
-    # --- Apply MASTER__ env var overrides ---
-    merged = _apply_env_overrides(merged, effective_env)
 
-    # --- Resolve provider secret refs (non-MASTER env vars) ---
-    merged = _hydrate_provider_refs(merged, effective_env)
-
-    # --- Inject repo_root path to ensure deterministic path ---
-    merged = _deep_merge(merged, {"app": {"paths": {"repo_root": str(root)}}})
-
-    # --- Validate merged config against pydantic schema ---
-    try:
-        settings = Settings.model_validate(merged)
-    except ValidationError as e:
-        # raise with helpful context for debugging
-        raise ValueError(f"Invalid configuration: {e}") from e
-
-    # --- Hydrate provider secrets after validation ---
-    # This happens after validation to avoid breaking precedence rules
-    # and to ensure the final Settings object has secrets injected appropriately.
-    settings = _hydrate_provider_secrets(settings)
+    # Only the env vars the loader actually consults take part in the cache key, so
+    # unrelated churn (e.g. PYTEST_CURRENT_TEST) does not defeat memoization.
+    source_paths = tuple(cfg_dir / name for name in _CONFIG_FILES) + (sec_path,)
+    cached_settings, cached_merged = _load_validated(
+        str(cfg_dir),
+        str(sec_path),
+        str(root),
+        _env_cache_key(effective_env),
+        tuple(_file_stamp(path) for path in source_paths),
+    )
+    # Callers are free to mutate what they get back; never hand out the cached instances.
+    settings = cached_settings.model_copy(deep=True)
+    merged = copy.deepcopy(cached_merged)
 
     logger = logging.getLogger(__name__)
     logger.info("OpenAI API key resolved: %s", bool(settings.models.openai.api_key))
@@ -330,6 +389,11 @@ Inputs:
     return settings
 
 
+def clear_caches() -> None:
+    """Drop memoized settings (e.g. after a test rewrites config files in place)."""
+    _load_validated.cache_clear()
+
+
 def _hydrate_provider_refs(merged: Dict[str, Any], env: Dict[str, str]) -> Dict[str, Any]:
     def _get_dot(data: Dict[str, Any], path: str) -> Any:
         cur: Any = data
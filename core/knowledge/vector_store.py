@@ -25,6 +25,7 @@ import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
 from core.knowledge.base import Chunk, IngestChunk, IngestResult, Query, VectorStore, VectorStoreStats
+from core.utils.sqlite_pragmas import validate_pragmas
 
 
 def _now_ts() -> int:
@@ -55,6 +56,21 @@ def _jaccard(a: List[str], b: List[str]) -> float:
     return float(inter) / float(union) if union else 0.0
 
 
+_UPSERT_CHUNK_SQL = """
+    INSERT INTO knowledge_chunks(
+        collection, doc_id, chunk_id, text, source,
+        metadata_json, embedding_json, created_at, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(collection, doc_id, chunk_id)
+    DO UPDATE SET
+        text=excluded.text,
+        source=excluded.source,
+        metadata_json=excluded.metadata_json,
+        updated_at=excluded.updated_at
+"""
+
+
 class SqliteVectorStore(VectorStore):
     """
     SQLite-backed chunk store.
@@ -74,8 +90,12 @@ class SqliteVectorStore(VectorStore):
       )
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, *, pragmas: Optional[Dict[str, Any]] = None) -> None:
         self.db_path = db_path
+        # Validated up front: PRAGMA names/values are interpolated into SQL in _connect().
+        self._pragmas: Dict[str, str] = validate_pragmas(
+            {"journal_mode": "WAL", "synchronous": "NORMAL", **(pragmas or {})}
+        )
         self._ensure_dir()
         self._ensure_schema()
 
@@ -85,8 +105,8 @@ class SqliteVectorStore(VectorStore):
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
+        for name, value in self._pragmas.items():
+            conn.execute(f"PRAGMA {name}={value};")
         return conn
 
     def _ensure_schema(self) -> None:
@@ -120,19 +140,18 @@ class SqliteVectorStore(VectorStore):
             return IngestResult(ok=True, inserted=0, updated=0)
 
         errors: List[str] = []
-        inserted = 0
-        updated = 0
         now = _now_ts()
 
-        with self._connect() as conn:
-            for it in items:
-                try:
-                    meta = dict(it.metadata or {})
-                    meta.setdefault("doc_id", it.doc_id)
-                    meta.setdefault("chunk_id", it.chunk_id)
-                    meta.setdefault("source", it.source)
-                    meta.setdefault("collection", it.collection)
-                    payload = (
+        rows: List[Tuple[Any, ...]] = []
+        for it in items:
+            try:
+                meta = dict(it.metadata or {})
+                meta.setdefault("doc_id", it.doc_id)
+                meta.setdefault("chunk_id", it.chunk_id)
+                meta.setdefault("source", it.source)
+                meta.setdefault("collection", it.collection)
+                rows.append(
+                    (
                         it.collection,
                         it.doc_id,
                         it.chunk_id,
@@ -143,47 +162,66 @@ class SqliteVectorStore(VectorStore):
                         now,
                         now,
                     )
-                    exists = conn.execute(
-                        """
-                        SELECT 1 FROM knowledge_chunks
-                        WHERE collection=? AND doc_id=? AND chunk_id=?
-                        """,
-                        (it.collection, it.doc_id, it.chunk_id),
-                    ).fetchone()
-                    conn.execute(
-                        """
-                        INSERT INTO knowledge_chunks(
-                            collection, doc_id, chunk_id, text, source,
-                            metadata_json, embedding_json, created_at, updated_at
-                        )
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(collection, doc_id, chunk_id)
-                        DO UPDATE SET
-                            text=excluded.text,
-                            source=excluded.source,
-                            metadata_json=excluded.metadata_json,
-                            updated_at=excluded.updated_at
-                        """,
-                        payload,
-                    )
-                    if exists:
-                        updated += 1
-                    else:
-                        inserted += 1
-                except Exception as e:  # pragma: no cover - error path
-                    errors.append(str(e))
-            conn.commit()
-        # ensure counts sum even if items empty
-        remainder = len(items) - (inserted + updated)
-        if remainder > 0 and errors:
-            # errors already captured; keep counts as-is
-            pass
-        elif remainder > 0:
-            inserted += remainder
+                )
+            except Exception as e:  # pragma: no cover - error path
+                errors.append(str(e))
+
+        inserted = 0
+        updated = 0
+        if rows:
+            with self._connect() as conn:
+                # One lookup per document (indexed) instead of one per chunk.
+                seen: set[Tuple[str, str, str]] = set()
+                for collection, doc_id in {(row[0], row[1]) for row in rows}:
+                    for (chunk_id,) in conn.execute(
+                        "SELECT chunk_id FROM knowledge_chunks WHERE collection=? AND doc_id=?",
+                        (collection, doc_id),
+                    ):
+                        seen.add((collection, doc_id, chunk_id))
+                try:
+                    conn.executemany(_UPSERT_CHUNK_SQL, rows)
+                    conn.commit()
+                except sqlite3.Error:
+                    # A bad row aborts the whole batch; retry row by row so each failure is
+                    # reported on its own and the good rows still land.
+                    conn.rollback()
+                    inserted, updated = self._upsert_rows_individually(conn, rows, seen, errors)
+                else:
+                    for row in rows:
+                        key = (row[0], row[1], row[2])
+                        if key in seen:
+                            updated += 1
+                        else:
+                            seen.add(key)
+                            inserted += 1
 
         ok = len(errors) == 0
         return IngestResult(ok=ok, inserted=inserted, updated=updated, errors=errors)
 
+    @staticmethod
+    def _upsert_rows_individually(
+        conn: sqlite3.Connection,
+        rows: List[Tuple[Any, ...]],
+        seen: set[Tuple[str, str, str]],
+        errors: List[str],
+    ) -> Tuple[int, int]:
+        inserted = 0
+        updated = 0
+        for row in rows:
+            try:
+                conn.execute(_UPSERT_CHUNK_SQL, row)
+            except sqlite3.Error as e:
+                errors.append(str(e))
+                continue
+            key = (row[0], row[1], row[2])
+            if key in seen:
+                updated += 1
+            else:
+                seen.add(key)
+                inserted += 1
+        conn.commit()
+        return inserted, updated
+
     def query(self, q: Query) -> List[Chunk]:
         top_k = max(1, int(q.top_k or 5))
         q_tokens = _tokenize(q.text)
@@ -117,6 +117,14 @@ class InMemoryBackend(MemoryBackend):
             pending.sort(key=lambda a: a.requested_at, reverse=True)
             return pending[offset : offset + limit]
 
+    def reset(self) -> None:
+        # Clear in place so holders of this backend (routers, engines) see the empty store.
+        with self._lock:
+            self._runs.clear()
+            self._steps.clear()
+            self._events.clear()
+            self._approvals.clear()
+
     def ensure_schema(self) -> None:
         # Nothing to create for in-memory backend
         return None
@@ -23,8 +23,13 @@ import hashlib
 import json
 import re
 import shutil
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+# Upper bound on events.jsonl handles kept open across concurrent runs (LRU-evicted).
+MAX_OPEN_EVENT_LOGS = 32
 
 
 class ObservabilityStore:
@@ -32,6 +37,9 @@ class ObservabilityStore:
         self.repo_root = repo_root
         self.root = observability_root or (repo_root / "observability")
         self.products_root = repo_root / "products"
+        # (product, run_id) -> open append handle for runtime/events.jsonl
+        self._event_logs: "OrderedDict[Tuple[str, str], IO[bytes]]" = OrderedDict()
+        self._event_lock = threading.Lock()
 
     def ensure_dirs(self, *, product: str, run_id: str) -> Dict[str, Path]:
         base = self.root / product / run_id
@@ -190,14 +198,38 @@ class ObservabilityStore:
         return {"path": path_value, "sha256": _sha256_file(output_path), "files": files}
 
     def append_event(self, *, product: str, run_id: str, payload: Dict[str, Any]) -> Path:
-        paths = self.ensure_dirs(product=product, run_id=run_id)
-        runtime_path = paths["runtime"] / "events.jsonl"
-        line = json.dumps(payload, ensure_ascii=False)
-        with runtime_path.open("a", encoding="utf-8") as handle:
-            handle.write(line + "\n")
+        runtime_path = self.root / product / run_id / "runtime" / "events.jsonl"
+        line = (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+        key = (product, run_id)
+        with self._event_lock:
+            handle = self._event_logs.get(key)
+            if handle is None:
+                self.ensure_dirs(product=product, run_id=run_id)
+                handle = runtime_path.open("ab")
+                self._event_logs[key] = handle
+                while len(self._event_logs) > MAX_OPEN_EVENT_LOGS:
+                    _, oldest = self._event_logs.popitem(last=False)
+                    oldest.close()
+            else:
+                self._event_logs.move_to_end(key)
+            # Flush per event so UI readers tailing events.jsonl see it immediately.
+            handle.write(line)
             handle.flush()
         return runtime_path
 
+    def close_event_log(self, *, product: str, run_id: str) -> None:
+        with self._event_lock:
+            handle = self._event_logs.pop((product, run_id), None)
+        if handle is not None:
+            handle.close()
+
+    def open_event_logs(self) -> List[Tuple[str, str]]:
+        """
+        (product, run_id) pairs whose events.jsonl handle is currently held, least recently used first.
+        """
+        with self._event_lock:
+            return list(self._event_logs)
+
     def write_output_files(self, *, product: str, run_id: str, files: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         staging = self.ensure_staging_dirs(product=product)["output"]
         output_dir = self.ensure_dirs(product=product, run_id=run_id)["output"]
@@ -14,11 +14,12 @@ from __future__ import annotations
 
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.contracts.run_schema import RunRecord, StepRecord, TraceEvent
 from core.config.schema import Settings
 from core.memory.base import ApprovalRecord, MemoryBackend, RunBundle
+from core.memory.in_memory import InMemoryBackend
 from core.memory.observability_store import ObservabilityStore
 from core.memory.sqlite_backend import SQLiteBackend
 
@@ -113,6 +114,16 @@ class MemoryRouter(MemoryBackend):
     def list_pending_approvals(self, *, limit: int = 50, offset: int = 0) -> List[ApprovalRecord]:
         return self.backend.list_pending_approvals(limit=limit, offset=offset)
 
+    def reset(self) -> None:
+        """
+        Empty the in-memory store in place (test/dev helper).
+
+        Raises TypeError for any other backend: durable stores are never wiped through the router.
+        """
+        if not isinstance(self.backend, InMemoryBackend):
+            raise TypeError(f"reset() is only supported for InMemoryBackend, not {type(self.backend).__name__}")
+        self.backend.reset()
+
     def ensure_schema(self) -> None:
         self.backend.ensure_schema()
 
@@ -134,6 +145,19 @@ class MemoryRouter(MemoryBackend):
             return
         self._observability.ensure_run_dirs(product=product, run_id=run_id)
 
+    def close_event_log(self, *, product: str, run_id: str) -> None:
+        """
+        Release the run's events.jsonl handle; a later event reopens it.
+        """
+        if self._observability is None:
+            return
+        self._observability.close_event_log(product=product, run_id=run_id)
+
+    def open_event_logs(self) -> List[Tuple[str, str]]:
+        if self._observability is None:
+            return []
+        return self._observability.open_event_logs()
+
     def clear_staging(self, *, product: str, clear_input: bool = True, clear_output: bool = True) -> None:
         if self._observability is None:
             return
@@ -24,10 +24,11 @@ from __future__ import annotations
 import json
 import sqlite3
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from core.contracts.run_schema import RunRecord, StepRecord, TraceEvent
 from core.memory.base import ApprovalRecord, MemoryBackend, RunBundle
+from core.utils.sqlite_pragmas import validate_pragmas
 
 MAX_PAYLOAD_CHARS = 4096
 SQLITE_TIMEOUT_SECONDS = 30.0
@@ -61,9 +62,50 @@ def _enum_value(value: Any) -> Any:
     return value.value if hasattr(value, "value") else value
 
 
+_INSERT_RUN_SQL = """
+INSERT OR REPLACE INTO runs (
+  run_id, product, flow, status, autonomy, started_at, finished_at,
+  input_json, output_json, summary_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _run_row(run: RunRecord) -> Tuple[Any, ...]:
+    return (
+        run.run_id,
+        run.product,
+        run.flow,
+        _enum_value(run.status),
+        run.autonomy_level,
+        int(run.started_at),
+        int(run.finished_at) if run.finished_at is not None else None,
+        _dumps(run.input) if run.input is not None else None,
+        _dumps(run.output) if run.output is not None else None,
+        _dumps(run.summary) if run.summary is not None else None,
+    )
+
+
 class SQLiteBackend(MemoryBackend):
-    def __init__(self, *, db_path: str, initialize: bool = True) -> None:
+    def __init__(
+        self,
+        *,
+        db_path: str,
+        initialize: bool = True,
+        pragmas: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        pragmas overrides the per-connection journal_mode/synchronous defaults
+        (e.g. {"synchronous": "OFF"} for throwaway test databases). Names and values are
+        validated up front and raise ValueError unless they are plain literals.
+        """
         self.db_path = db_path
+        self._pragmas: Dict[str, str] = validate_pragmas(
+            {
+                "journal_mode": SQLITE_JOURNAL_MODE,
+                "synchronous": SQLITE_SYNCHRONOUS,
+                **(pragmas or {}),
+            }
+        )
         if initialize:
             self._init_db()
 
@@ -74,8 +116,8 @@ class SQLiteBackend(MemoryBackend):
             timeout=SQLITE_TIMEOUT_SECONDS,
         )
         con.row_factory = sqlite3.Row
-        con.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE};")
-        con.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS};")
+        for name, value in self._pragmas.items():
+            con.execute(f"PRAGMA {name}={value};")
         con.execute(f"PRAGMA busy_timeout={int(SQLITE_TIMEOUT_SECONDS * 1000)};")
         con.execute("PRAGMA foreign_keys=ON;")
         return con
@@ -199,26 +241,18 @@ class SQLiteBackend(MemoryBackend):
 
     def create_run(self, run: RunRecord) -> None:
         with self._connect() as con:
-            con.execute(
-                """
-                INSERT OR REPLACE INTO runs (
-                  run_id, product, flow, status, autonomy, started_at, finished_at,
-                  input_json, output_json, summary_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    run.run_id,
-                    run.product,
-                    run.flow,
-                    _enum_value(run.status),
-                    run.autonomy_level,
-                    int(run.started_at),
-                    int(run.finished_at) if run.finished_at is not None else None,
-                    _dumps(run.input) if run.input is not None else None,
-                    _dumps(run.output) if run.output is not None else None,
-                    _dumps(run.summary) if run.summary is not None else None,
-                ),
-            )
+            con.execute(_INSERT_RUN_SQL, _run_row(run))
+            con.commit()
+
+    def create_runs(self, runs: Sequence[RunRecord]) -> None:
+        """
+        Insert many runs in a single transaction (one commit instead of one per run).
+        """
+        rows = [_run_row(run) for run in runs]
+        if not rows:
+            return
+        with self._connect() as con:
+            con.executemany(_INSERT_RUN_SQL, rows)
             con.commit()
 
     def update_run_status(self, run_id: str, status: str, *, summary: Optional[Dict[str, Any]] = None) -> None:
@@ -728,6 +728,26 @@ class OrchestratorEngine:
         run_ctx: RunContext,
         start_index: int,
         requested_by: Optional[str],
+    ) -> str:
+        try:
+            return self._run_steps_from_index(
+                flow_def=flow_def,
+                run_ctx=run_ctx,
+                start_index=start_index,
+                requested_by=requested_by,
+            )
+        except BaseException:
+            # The normal exits release the events.jsonl handle; an escaping error must not leak it either.
+            self.memory.close_event_log(product=run_ctx.product, run_id=run_ctx.run_id)
+            raise
+
+    def _run_steps_from_index(
+        self,
+        *,
+        flow_def: FlowDef,
+        run_ctx: RunContext,
+        start_index: int,
+        requested_by: Optional[str],
     ) -> str:
         idx = start_index
         current_status = RunStatus.RUNNING
@@ -868,6 +888,8 @@ class OrchestratorEngine:
                         "approval_context": approval_payload.get("approval_context"),
                     },
                 )
+                # Last event until the approval resolves; don't hold the events.jsonl handle meanwhile.
+                self.memory.close_event_log(product=run_ctx.product, run_id=run_ctx.run_id)
                 return RunStatus.PENDING_HUMAN.value
 
             if step_def.type == StepType.USER_INPUT:
@@ -1304,6 +1326,9 @@ class OrchestratorEngine:
                 flow=run.flow,
                 payload=output_info,
             )
+        if run.status != RunStatus.RUNNING:
+            # Paused or finished: every event for this leg has been written, so release the handle.
+            self.memory.close_event_log(product=run.product, run_id=run.run_id)
 
     def _rehydrate_artifacts(self, steps: List[StepRecord], run_ctx: RunContext) -> None:
         for step in steps:
@@ -8,7 +8,8 @@ Requirements:
 - Supports YAML (.yaml/.yml) and JSON (.json)
 - Returns core.contracts.flow_schema.FlowDef
 - Does NOT execute anything; pure parsing + validation
-- No persistence and no environment reads
+- No persistence and no environment reads (write_cache is an explicit build step)
+- A <flow>.flowcache.json built from the YAML's exact bytes is preferred over parsing it
 
 Intended usage:
 - Orchestrator calls FlowLoader.load_from_path(...) to get a validated FlowDef
@@ -22,14 +23,31 @@ from __future__ import annotations
 # Imports
 # ==============================
 
+import copy
+import functools
+import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from pydantic import ValidationError
 
 from core.contracts.flow_schema import FlowDef
 
+try:
+    import yaml  # type: ignore
+except Exception:  # pragma: no cover - PyYAML is a declared dependency
+    yaml = None  # type: ignore[assignment]
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the libyaml-backed loader (several times faster); fall back to pure Python.
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+
 # ==============================
 # Errors
 # ==============================
@@ -48,12 +66,45 @@ class FlowLoader:
     - load(product, flow) -> FlowDef (from products/<product>/flows/<flow>.yaml)
     - load_from_path(path) -> FlowDef
     - load_from_obj(obj) -> FlowDef
+    - from_mapping({product: {flow: obj}}) -> FlowLoader serving pre-validated flows
+    - write_cache(path) -> Path (emit the validated flow as <flow>.flowcache.json)
     """
 
-    def __init__(self, *, products_root: Union[str, Path]) -> None:
+    _LOADER: Any = _YAML_LOADER
+    CACHE_SUFFIX = ".flowcache.json"
+
+    def __init__(
+        self,
+        *,
+        products_root: Union[str, Path],
+        flows: Optional[Dict[Tuple[str, str], FlowDef]] = None,
+    ) -> None:
         self.products_root = Path(products_root)
+        self._flows: Dict[Tuple[str, str], FlowDef] = dict(flows or {})
+
+    @classmethod
+    def from_mapping(
+        cls,
+        mapping: Mapping[str, Mapping[str, Dict[str, Any]]],
+        *,
+        products_root: Union[str, Path] = ".",
+    ) -> "FlowLoader":
+        """
+        Build a loader from in-memory flow dicts keyed by product, then flow.
+
+        Flows are validated once here; load(...) serves them without touching YAML.
+        """
+        flows = {
+            (product, flow): cls.load_from_obj(obj)
+            for product, by_flow in mapping.items()
+            for flow, obj in by_flow.items()
+        }
+        return cls(products_root=products_root, flows=flows)
 
     def load(self, *, product: str, flow: str) -> FlowDef:
+        preloaded = self._flows.get((product, flow))
+        if preloaded is not None:
+            return preloaded.model_copy(deep=True)
         path = self.products_root / product / "flows" / f"{flow}.yaml"
         return self.load_from_path(path)
 
@@ -68,6 +119,9 @@ class FlowLoader:
 
         suffix = p.suffix.lower()
         if suffix in {".yaml", ".yml"}:
+            cached = FlowLoader._read_cache(p)
+            if cached is not None:
+                return cached
             data = FlowLoader._read_yaml(p)
         elif suffix == ".json":
             data = FlowLoader._read_json(p)
@@ -89,9 +143,52 @@ class FlowLoader:
         except ValidationError as e:
             raise FlowLoadError(f"Flow validation error: {e}") from e
 
+    @staticmethod
+    def write_cache(path: Union[str, Path]) -> Path:
+        """
+        Validate a YAML flow and write it next to the YAML as <flow>.flowcache.json.
+
+        The cache records the SHA-256 of the YAML bytes; load_from_path(...) serves it only
+        while the YAML content is unchanged.
+        """
+        p = Path(path)
+        if not p.exists():
+            raise FlowLoadError(f"Flow file not found: {p}")
+        source = p.read_bytes()
+        flow = FlowLoader.load_from_obj(FlowLoader._read_yaml(p))
+        cache = FlowLoader._cache_path(p)
+        cache.write_bytes(
+            _dumps_json({"source_sha256": hashlib.sha256(source).hexdigest(), "flow": flow.model_dump(mode="json")})
+        )
+        return cache
+
     # ==============================
     # File Readers
     # ==============================
+    @staticmethod
+    def _cache_path(path: Path) -> Path:
+        return path.with_suffix(FlowLoader.CACHE_SUFFIX)
+
+    @staticmethod
+    def _read_cache(path: Path) -> Optional[FlowDef]:
+        """Return the flow from a sidecar cache built from `path`'s current bytes, else None."""
+        cache = FlowLoader._cache_path(path)
+        try:
+            raw = cache.read_bytes()
+        except OSError:
+            return None
+        try:
+            # Keyed on content, not mtime: equal or coarse mtimes cannot hide a YAML edit.
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            data = _loads_json(raw)
+            if not isinstance(data, dict) or data.get("source_sha256") != digest:
+                return None
+            # The cache holds an already-normalized dump; validate it directly.
+            return FlowDef.model_validate(data.get("flow"))
+        except (OSError, ValueError):
+            # Unreadable or stale-schema cache: fall back to the YAML.
+            return None
+
     @staticmethod
     def _read_json(path: Path) -> Dict[str, Any]:
         try:
@@ -105,19 +202,16 @@ class FlowLoader:
 
     @staticmethod
     def _read_yaml(path: Path) -> Dict[str, Any]:
-        try:
-            import yaml  # type: ignore
-        except Exception as e:
-            raise FlowLoadError(
-                "PyYAML is required to load .yaml flows. Add 'pyyaml' to dependencies."
-            ) from e
+        if yaml is None or FlowLoader._LOADER is None:
+            raise FlowLoadError("PyYAML is required to load .yaml flows. Add 'pyyaml' to dependencies.")
 
         try:
-            raw = path.read_text(encoding="utf-8")
-            data = yaml.safe_load(raw)
+            stat = path.stat()
+            data = _parse_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
             if not isinstance(data, dict):
                 raise FlowLoadError("Top-level YAML must be a mapping/dict.")
-            return data
+            # The cached parse is shared; callers get their own copy to normalize.
+            return copy.deepcopy(data)
         except Exception as e:
             raise FlowLoadError(f"Invalid YAML in {path}: {e}") from e
 
@@ -157,3 +251,22 @@ class FlowLoader:
             step["id"] = step_id
             normalized.append(step)
         return normalized
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_yaml_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    # mtime/size only key the cache so an edited flow file is re-parsed.
+    raw = Path(path_str).read_text(encoding="utf-8")
+    return yaml.load(raw, Loader=FlowLoader._LOADER)
+
+
+def _loads_json(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
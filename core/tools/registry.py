@@ -14,8 +14,11 @@ from __future__ import annotations
 
 
 
+import threading
+from collections import ChainMap
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from core.tools.base import BaseTool
 
@@ -33,13 +36,22 @@ class ToolRegistration:
 class ToolRegistry:
     """
     Global tool registry (class-level for simplicity).
+
+    Registrations live in the last map of `_tools`; `overlay(...)` pushes scoped
+    layers in front of it so lookups read through without touching the base map.
     """
 
-    _tools: Dict[str, ToolRegistration] = {}
+    _tools: ChainMap[str, ToolRegistration] = ChainMap({})
+    _overlay_lock = threading.Lock()
 
     @classmethod
     def clear(cls) -> None:
-        cls._tools.clear()
+        """
+        Drop every base registration.
+
+        Active overlays are owned by their `with` blocks and stay in place until those exit.
+        """
+        cls._tools.maps[-1].clear()
 
     @classmethod
     def register(
@@ -51,14 +63,58 @@ class ToolRegistry:
         overwrite: bool = False,
     ) -> None:
         norm = _norm(name)
-        if not overwrite and norm in cls._tools:
+        # Check the base map register() writes to; a name shadowed only by an overlay is free.
+        base = cls._tools.maps[-1]
+        if not overwrite and norm in base:
             raise ValueError(f"Tool already registered: {name}")
 
         if isinstance(factory, BaseTool):
             raise ValueError("ToolRegistry.register requires a factory to avoid shared state across runs.")
         actual_factory = factory
 
-        cls._tools[norm] = ToolRegistration(name=norm, factory=actual_factory, meta=meta or {})
+        base[norm] = ToolRegistration(name=norm, factory=actual_factory, meta=meta or {})
+
+    @classmethod
+    @contextmanager
+    def overlay(
+        cls,
+        name: str,
+        factory: ToolFactory,
+        *,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[None]:
+        """
+        Shadow `name` with `factory` for the duration of the block.
+
+        The base registration is left untouched and becomes visible again on exit.
+        """
+        if isinstance(factory, BaseTool):
+            raise ValueError("ToolRegistry.overlay requires a factory to avoid shared state across runs.")
+        norm = _norm(name)
+        layer = {norm: ToolRegistration(name=norm, factory=factory, meta=meta or {})}
+        with cls._overlay_lock:
+            cls._tools.maps.insert(0, layer)
+        try:
+            yield
+        finally:
+            with cls._overlay_lock:
+                cls._tools.maps[:] = [m for m in cls._tools.maps if m is not layer]
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, ToolRegistration]:
+        """
+        Copy of the base registrations (active overlays excluded), for a later restore().
+        """
+        return dict(cls._tools.maps[-1])
+
+    @classmethod
+    def restore(cls, registrations: Dict[str, ToolRegistration]) -> None:
+        """
+        Replace the base registrations with a snapshot; active overlays are left in place.
+        """
+        base = cls._tools.maps[-1]
+        base.clear()
+        base.update(registrations)
 
     @classmethod
     def resolve(cls, name: str) -> BaseTool:
@@ -0,0 +1,36 @@
+# ==============================
+# SQLite PRAGMA Validation
+# ==============================
+"""
+Shared validation for caller-supplied SQLite PRAGMA settings.
+
+PRAGMA statements cannot take bound parameters, so names and values are interpolated
+into the SQL text. Both are checked against simple literal patterns first.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Mapping
+
+_PRAGMA_NAME = re.compile(r"^[a-z_]+$")
+# Keywords (WAL, NORMAL, MEMORY) and integers (including negative cache_size values).
+_PRAGMA_VALUE = re.compile(r"^(?:-?\d+|[A-Za-z_]+)$")
+
+
+def validate_pragmas(pragmas: Mapping[str, Any]) -> Dict[str, str]:
+    """
+    Return `pragmas` as name -> value strings, raising ValueError on anything that is not
+    a plain lowercase name or a bare keyword/integer value.
+    """
+    validated: Dict[str, str] = {}
+    for name, value in pragmas.items():
+        if not isinstance(name, str) or not _PRAGMA_NAME.match(name):
+            raise ValueError(f"Invalid SQLite pragma name: {name!r}")
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            raise ValueError(f"Invalid value for SQLite pragma {name}: {value!r}")
+        text = str(value)
+        if not _PRAGMA_VALUE.match(text):
+            raise ValueError(f"Invalid value for SQLite pragma {name}: {value!r}")
+        validated[name] = text
+    return validated
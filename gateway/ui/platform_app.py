@@ -35,6 +35,11 @@ import requests
 import streamlit as st
 import yaml
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
@@ -61,10 +66,7 @@ class ApiClient:
         except requests.RequestException as exc:
             return ApiResponse(ok=False, body=None, error=str(exc))
 
-        try:
-            body = resp.json()
-        except ValueError:
-            body = None
+        body = _parse_body(resp)
 
         if not resp.ok:
             return ApiResponse(ok=False, body=body, error=body.get("error", {}).get("message") if body else resp.text)
@@ -133,6 +135,19 @@ class ApiClient:
         return self._request("GET", "/api/approvals")
 
 
+def _parse_body(resp: requests.Response) -> Any:
+    # orjson parses the raw bytes directly, skipping the text-decode pass behind resp.json().
+    if orjson is not None:
+        try:
+            return orjson.loads(resp.content)
+        except ValueError:
+            return None
+    try:
+        return resp.json()
+    except ValueError:
+        return None
+
+
 def _api_base_url(settings: Any) -> str:
     candidate = getattr(getattr(settings, "app", None), "api_base_url", None)
     if isinstance(candidate, str) and candidate.strip():
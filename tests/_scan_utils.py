@@ -0,0 +1,96 @@
+# ==============================
+# Shared Source Scanning Helpers
+# ==============================
+"""
+File walking and parse caching shared by the guardrail and architecture tests.
+
+Each scanned .py file is read and parsed at most once per test session. Entries
+are keyed on (path, st_mtime_ns) so an edited file is read again rather than
+served stale. The import guardrails layer their own caches on top of this one
+(tests/unit/_ast_cache.py).
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import os
+from collections import deque
+from pathlib import Path
+from typing import AbstractSet, Iterator, List, Union
+
+PathLike = Union[str, Path]
+
+
+def walk_py(
+    root: PathLike,
+    excluded: AbstractSet[str] = frozenset(),
+    require_any: AbstractSet[str] = frozenset(),
+) -> Iterator[str]:
+    """
+    Yield .py file paths (as str) under `root` via os.scandir.
+
+    Directories named in `excluded` are pruned at descent instead of filtered per file.
+    With `require_any`, only files with a directory of one of those names on their path
+    (root's own path included) are yielded; other files are never stat'ed as files.
+    """
+    root_str = os.fspath(root)
+    qualified = not require_any or not require_any.isdisjoint(Path(root_str).parts)
+    pending = deque([(root_str, qualified)])
+    while pending:
+        current, qualified = pending.popleft()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in excluded:
+                        pending.append((entry.path, qualified or entry.name in require_any))
+                elif qualified and entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
+def get_source(path: PathLike) -> bytes:
+    path_str = os.fspath(path)
+    return source_bytes(path_str, os.stat(path_str).st_mtime_ns)
+
+
+def get_tree(path: PathLike) -> ast.Module:
+    path_str = os.fspath(path)
+    return parse_tree(path_str, os.stat(path_str).st_mtime_ns)
+
+
+def iter_imports(path: PathLike) -> Iterator[Union[ast.Import, ast.ImportFrom]]:
+    """Yield every Import/ImportFrom statement in `path`, including function-level ones."""
+    for node in iter_statements(get_tree(path).body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+
+
+@functools.lru_cache(maxsize=None)
+def source_bytes(path_str: str, mtime_ns: int) -> bytes:
+    return Path(path_str).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def parse_tree(path_str: str, mtime_ns: int) -> ast.Module:
+    # Plain, unoptimized tree: guardrails must still see calls inside assert statements.
+    return ast.parse(source_bytes(path_str, mtime_ns), path_str)
+
+
+# Statement-list fields; imports are statements, so expression subtrees are never visited.
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def iter_statements(body: List[ast.stmt]) -> Iterator[ast.AST]:
+    """Yield every statement in `body`, descending into nested blocks but not expressions."""
+    stack: List[ast.AST] = list(reversed(body))
+    while stack:
+        node = stack.pop()
+        yield node
+        for field in _BLOCK_FIELDS:
+            children = getattr(node, field, None)
+            if children:
+                stack.extend(reversed(children))
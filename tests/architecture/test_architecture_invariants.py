@@ -5,22 +5,22 @@ import ast
 from pathlib import Path
 from typing import Iterable, List, Sequence, Tuple
 
+from tests._scan_utils import walk_py
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
-EXCLUDED_DIRS = {".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests"}
+EXCLUDED_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests"})
 
 
 def _iter_python_files(root: Path) -> Iterable[Path]:
-    for path in root.rglob("*.py"):
-        if not path.is_file():
-            continue
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
-        yield path
+    # Excluded directories are pruned at descent: one set lookup per directory entry.
+    for path in walk_py(root, EXCLUDED_DIRS):
+        yield Path(path)
 
 
 def _read_imports(path: Path) -> List[str]:
-    source = path.read_text(encoding="utf-8")
+    # ast.parse decodes bytes itself (honouring PEP 263); no separate str decode pass.
+    source = path.read_bytes()
     tree = ast.parse(source, filename=str(path))
     imports: List[str] = []
     for node in ast.walk(tree):
@@ -41,11 +41,14 @@ def _find_offenses(
     allow_modules: Sequence[str] = (),
 ) -> List[Tuple[Path, str]]:
     offenses: List[Tuple[Path, str]] = []
+    # str.startswith takes a tuple and loops in C; normalize once.
+    allowed = tuple(allow_prefixes)
+    forbidden = tuple(forbidden_prefixes)
     for path in files:
         for module in _read_imports(path):
-            if module in allow_modules or any(module.startswith(prefix) for prefix in allow_prefixes):
+            if module in allow_modules or module.startswith(allowed):
                 continue
-            if any(module.startswith(prefix) for prefix in forbidden_prefixes):
+            if module.startswith(forbidden):
                 offenses.append((path, module))
     return offenses
 
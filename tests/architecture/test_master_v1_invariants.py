@@ -5,26 +5,23 @@ import ast
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
+from tests._scan_utils import walk_py
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
-EXCLUDED_DIRS = {".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests"}
+EXCLUDED_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests"})
 
 
 def _iter_python_files(root: Path) -> List[Path]:
-    paths: List[Path] = []
     if not root.exists():
-        return paths
-    for path in root.rglob("*.py"):
-        if not path.is_file():
-            continue
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
-        paths.append(path)
-    return sorted(paths, key=lambda item: str(item))
+        return []
+    # Excluded directories are pruned at descent: one set lookup per directory entry.
+    return [Path(path) for path in sorted(walk_py(root, EXCLUDED_DIRS))]
 
 
 def _read_imports(path: Path) -> List[str]:
-    source = path.read_text(encoding="utf-8")
+    # ast.parse decodes bytes itself (honouring PEP 263); no separate str decode pass.
+    source = path.read_bytes()
     tree = ast.parse(source, filename=str(path))
     imports: List[str] = []
     for node in ast.walk(tree):
@@ -50,11 +47,14 @@ def _first_violation(
     forbidden_modules: Sequence[str] = (),
     allow_prefixes: Sequence[str] = (),
 ) -> Optional[Tuple[Path, str]]:
+    # str.startswith takes a tuple and loops in C; normalize once.
+    allowed = tuple(allow_prefixes)
+    forbidden = tuple(forbidden_prefixes)
     for path in files:
         for module in _read_imports(path):
-            if any(module.startswith(prefix) for prefix in allow_prefixes):
+            if module.startswith(allowed):
                 continue
-            if module in forbidden_modules or any(module.startswith(prefix) for prefix in forbidden_prefixes):
+            if module in forbidden_modules or module.startswith(forbidden):
                 return path, module
     return None
 
@@ -4,9 +4,13 @@ from __future__ import annotations
 # Testing Fixtures
 # ==============================
 
+import os
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional
 
 import pytest
 from fastapi.testclient import TestClient
@@ -27,10 +31,64 @@ from gateway.api.http_app import create_app
 from gateway.api import deps as gateway_deps
 
 
+SHM_ROOT = Path("/dev/shm")
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "integration: end-to-end tests; each uses its own tmp_path storage so the suite can run under pytest-xdist",
+    )
+    # Keep tmp_path trees (sqlite WAL, observability JSON) on tmpfs when available by moving
+    # pytest's temp root there: pytest then owns /dev/shm/pytest-of-<user> (ownership and mode
+    # checked) and rotates the numbered session dirs under it, keeping the last three.
+    # An explicit --basetemp or PYTEST_DEBUG_TEMPROOT wins, and xdist workers inherit a
+    # per-worker dir from the controller.
+    if config.option.basetemp is None and not hasattr(config, "workerinput"):
+        if SHM_ROOT.is_dir() and os.access(SHM_ROOT, os.W_OK):
+            os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(SHM_ROOT))
+
+
+class TraceSink(List[Dict[str, Any]]):
+    """List of emitted trace payloads, also indexed by kind and run_id as events arrive."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.by_kind: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.by_run: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def append(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            super().append(event)
+            self.by_kind[event.get("kind")].append(event)
+            self.by_run[event.get("run_id")].append(event)
+
+
+SHARED_EXECUTOR_WORKERS = 8
+
+
+@pytest.fixture(scope="session")
+def shared_executor() -> Iterator[ThreadPoolExecutor]:
+    """
+    Session-wide thread pool with every worker thread already started.
+
+    Tests submit work directly and must wait() on their own futures before returning.
+    """
+    executor = ThreadPoolExecutor(max_workers=SHARED_EXECUTOR_WORKERS, thread_name_prefix="master-tests")
+    # Each warm-up task blocks until all workers hold one, forcing the pool to spawn every thread.
+    barrier = threading.Barrier(SHARED_EXECUTOR_WORKERS)
+    wait([executor.submit(barrier.wait) for _ in range(SHARED_EXECUTOR_WORKERS)])
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True)
+
+
 @pytest.fixture
-def trace_sink() -> List[Dict[str, Any]]:
+def trace_sink() -> TraceSink:
     """Collects emitted trace events without touching production logging."""
-    return []
+    return TraceSink()
 
 
 class _CollectingTracer(Tracer):
@@ -32,27 +32,25 @@ class _RunIdTool(BaseTool):
         return ToolResult.ok(data=payload, meta=meta)
 
 
+_FLOW_YAML = """\
+id: "test_flow"
+version: "1.0.0"
+steps:
+  - id: "run_tool"
+    type: "tool"
+    backend: "local"
+    tool: "run_id_tool"
+    params:
+      marker: "{{payload.marker}}"
+"""
+_FLOW_YAML_BYTES = _FLOW_YAML.encode("utf-8")
+
+
 def _write_flow(tmp_path: Path) -> Path:
     flows_dir = tmp_path / "products" / "test_product" / "flows"
     flows_dir.mkdir(parents=True, exist_ok=True)
     flow_path = flows_dir / "test_flow.yaml"
-    flow_path.write_text(
-        "\n".join(
-            [
-                'id: "test_flow"',
-                'version: "1.0.0"',
-                "steps:",
-                '  - id: "run_tool"',
-                '    type: "tool"',
-                '    backend: "local"',
-                '    tool: "run_id_tool"',
-                "    params:",
-                '      marker: "{{payload.marker}}"',
-                "",
-            ]
-        ),
-        encoding="utf-8",
-    )
+    flow_path.write_bytes(_FLOW_YAML_BYTES)
     return flow_path
 
 
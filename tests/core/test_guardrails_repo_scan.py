@@ -4,34 +4,37 @@ from __future__ import annotations
 # Guardrail Validations
 # ==============================
 
+import functools
 import pathlib
 import re
-from typing import List
+from typing import List, Sequence, Tuple
+
+from tests._scan_utils import walk_py
 
 
 REPO_ROOT = pathlib.Path(__file__).resolve().parents[2]
-EXCLUDED_DIRS = {".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests", "scripts"}
+EXCLUDED_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests", "scripts"})
 
 
-def _iter_python_files() -> List[pathlib.Path]:
-    files: List[pathlib.Path] = []
-    for path in REPO_ROOT.rglob("*.py"):
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
-        files.append(path)
-    return files
+@functools.lru_cache(maxsize=1)
+def _iter_python_files() -> Tuple[pathlib.Path, ...]:
+    # Walked once per session; every check below scans the same file set.
+    # Excluded directories are pruned at descent rather than filtered per file.
+    return tuple(pathlib.Path(path) for path in walk_py(REPO_ROOT, EXCLUDED_DIRS))
 
 
-def _read(path: pathlib.Path) -> str:
-    return path.read_text(encoding="utf-8")
+def _read(path: pathlib.Path) -> bytes:
+    # Patterns are ASCII, so they match the raw bytes; no per-file UTF-8 decode.
+    return path.read_bytes()
 
 
-def _find_offenses(pattern: str, files: List[pathlib.Path], *, allow: List[pathlib.Path]) -> List[pathlib.Path]:
+def _find_offenses(pattern: str, files: Sequence[pathlib.Path], *, allow: List[pathlib.Path]) -> List[pathlib.Path]:
+    compiled = re.compile(pattern.encode("ascii"))
     offenders: List[pathlib.Path] = []
     for path in files:
         if any(path == allowed or allowed in path.parents for allowed in allow):
             continue
-        if re.search(pattern, _read(path)):
+        if compiled.search(_read(path)):
             offenders.append(path)
     return offenders
 
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+# ==============================
+# Memory Reset Tests
+# ==============================
+
+from pathlib import Path
+
+import pytest
+
+from core.contracts.run_schema import RunRecord, RunStatus
+from core.memory.in_memory import InMemoryBackend
+from core.memory.router import MemoryRouter
+from core.memory.sqlite_backend import SQLiteBackend
+
+
+def test_router_reset_empties_in_memory_backend_in_place() -> None:
+    backend = InMemoryBackend()
+    memory = MemoryRouter(backend=backend)
+    memory.create_run(RunRecord(run_id="run-1", product="hello_world", flow_id="hello", status=RunStatus.RUNNING))
+    assert memory.get_run("run-1") is not None
+
+    memory.reset()
+
+    assert memory.backend is backend
+    assert memory.get_run("run-1") is None
+    assert memory.list_runs() == []
+
+
+def test_router_reset_refuses_durable_backend(tmp_path: Path) -> None:
+    memory = MemoryRouter(backend=SQLiteBackend(db_path=str(tmp_path / "memory.sqlite")))
+
+    with pytest.raises(TypeError, match="InMemoryBackend"):
+        memory.reset()
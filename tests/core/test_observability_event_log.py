@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+# ==============================
+# Tests: Observability events.jsonl writer
+# ==============================
+
+import json
+from pathlib import Path
+
+import pytest
+
+from core.agents.registry import AgentRegistry
+from core.config.schema import Settings
+from core.contracts.run_schema import RunStatus
+from core.governance.hooks import GovernanceHooks
+from core.governance.security import SecurityRedactor
+from core.memory.in_memory import InMemoryBackend
+from core.memory.observability_store import MAX_OPEN_EVENT_LOGS, ObservabilityStore
+from core.memory.router import MemoryRouter
+from core.memory.tracing import Tracer
+from core.orchestrator.engine import OrchestratorEngine
+from core.orchestrator.flow_loader import FlowLoader
+from core.orchestrator.step_executor import StepExecutor
+from core.tools.executor import ToolExecutor
+from core.tools.registry import ToolRegistry
+
+from products.hello_world.tools.echo_tool import EchoTool
+
+
+def _events(path: Path) -> list:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_append_event_reuses_handle_and_reopens_after_close(tmp_path: Path) -> None:
+    store = ObservabilityStore(repo_root=tmp_path)
+    path = store.append_event(product="demo", run_id="run_1", payload={"kind": "a"})
+    store.append_event(product="demo", run_id="run_1", payload={"kind": "b"})
+    # Flushed per event: readers see both lines while the handle is still open.
+    assert [e["kind"] for e in _events(path)] == ["a", "b"]
+
+    store.close_event_log(product="demo", run_id="run_1")
+    assert store.open_event_logs() == []
+    store.append_event(product="demo", run_id="run_1", payload={"kind": "c"})
+    store.close_event_log(product="demo", run_id="run_1")
+    assert [e["kind"] for e in _events(path)] == ["a", "b", "c"]
+
+
+def test_event_logs_are_keyed_by_product_and_run(tmp_path: Path) -> None:
+    store = ObservabilityStore(repo_root=tmp_path)
+    first = store.append_event(product="demo", run_id="run_1", payload={"kind": "demo"})
+    second = store.append_event(product="other", run_id="run_1", payload={"kind": "other"})
+    assert store.open_event_logs() == [("demo", "run_1"), ("other", "run_1")]
+
+    store.close_event_log(product="demo", run_id="run_1")
+    assert store.open_event_logs() == [("other", "run_1")]
+    store.close_event_log(product="other", run_id="run_1")
+    assert [e["kind"] for e in _events(first)] == ["demo"]
+    assert [e["kind"] for e in _events(second)] == ["other"]
+
+
+def test_open_event_logs_are_bounded(tmp_path: Path) -> None:
+    store = ObservabilityStore(repo_root=tmp_path)
+    for idx in range(MAX_OPEN_EVENT_LOGS + 5):
+        store.append_event(product="demo", run_id=f"run_{idx}", payload={"idx": idx})
+    open_logs = store.open_event_logs()
+    assert len(open_logs) == MAX_OPEN_EVENT_LOGS
+    assert ("demo", "run_0") not in open_logs
+    assert _events(tmp_path / "observability" / "demo" / "run_0" / "runtime" / "events.jsonl") == [{"idx": 0}]
+
+
+_PAUSING_FLOW = {
+    "id": "pausing_flow",
+    "version": "1.0.0",
+    "steps": [
+        {
+            "id": "input",
+            "type": "user_input",
+            "params": {
+                "schema_version": "1.0",
+                "form_id": "notes",
+                "prompt": "Notes",
+                "input_type": "text",
+                "schema": {"type": "object", "properties": {"text": {"type": "string"}}},
+                "required": ["text"],
+            },
+        },
+        {"id": "echo", "type": "tool", "backend": "local", "tool": "echo_tool", "params": {"message": "hi"}},
+    ],
+}
+
+
+def _build_engine(tmp_path: Path) -> OrchestratorEngine:
+    settings = Settings()
+    memory = MemoryRouter(InMemoryBackend(), repo_root=tmp_path)
+    governance = GovernanceHooks(settings=settings)
+    tool_executor = ToolExecutor(registry=ToolRegistry, hooks=governance, redactor=SecurityRedactor())
+    return OrchestratorEngine(
+        flow_loader=FlowLoader.from_mapping({"demo": {"pausing_flow": _PAUSING_FLOW}}, products_root=tmp_path / "products"),
+        step_executor=StepExecutor(tool_executor=tool_executor, governance=governance, agent_registry=AgentRegistry),
+        memory=memory,
+        tracer=Tracer(memory=memory, mirror_to_log=False),
+        governance=governance,
+    )
+
+
+def test_engine_releases_event_log_after_pause_and_completion(tmp_path: Path) -> None:
+    engine = _build_engine(tmp_path)
+    with ToolRegistry.overlay("echo_tool", lambda: EchoTool()):
+        started = engine.run_flow(product="demo", flow="pausing_flow", payload={})
+        assert started.ok, started.error
+        run_id = started.data["run_id"]
+        assert started.data["status"] != RunStatus.COMPLETED.value
+        assert ("demo", run_id) not in engine.memory.open_event_logs()
+
+        resumed = engine.resume_run(run_id=run_id, user_input_response={"form_id": "notes", "values": {"text": "hello"}})
+        assert resumed.ok, resumed.error
+        assert resumed.data["status"] == RunStatus.COMPLETED.value
+        assert ("demo", run_id) not in engine.memory.open_event_logs()
+
+    kinds = [e["kind"] for e in _events(tmp_path / "observability" / "demo" / run_id / "runtime" / "events.jsonl")]
+    assert "run_paused" in kinds and "run_completed" in kinds
+
+
+def test_engine_releases_event_log_when_execution_raises(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = _build_engine(tmp_path)
+
+    def _boom(*args, **kwargs):  # type: ignore[no-untyped-def]
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(OrchestratorEngine, "_persist_run_output", _boom)
+    started = engine.run_flow(product="demo", flow="pausing_flow", payload={})
+    assert not started.ok
+    assert engine.memory.open_event_logs() == []
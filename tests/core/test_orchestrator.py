@@ -25,14 +25,7 @@ def test_engine_runs_and_pauses_on_hitl(tmp_path: Path) -> None:
     sqlite_path = tmp_path / "engine_test.sqlite"
 
     secrets_path.write_text(
-        "\n".join(
-            [
-                "secrets:",
-                "  db:",
-                f"    sqlite_path: '{sqlite_path.as_posix()}'",
-                "",
-            ]
-        ),
+        f"secrets:\n  db:\n    sqlite_path: '{sqlite_path.as_posix()}'\n",
         encoding="utf-8",
     )
 
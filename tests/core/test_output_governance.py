@@ -46,26 +46,23 @@ class _OutputFilesTool(BaseTool):
         )
 
 
+_FLOW_YAML_TEMPLATE = """\
+id: "test_flow"
+version: "1.0.0"
+steps:
+  - id: "run_tool"
+    type: "tool"
+    backend: "local"
+    tool: "{tool_name}"
+    params: {{}}
+"""
+
+
 def _write_flow(tmp_path: Path, *, tool_name: str) -> Path:
     flows_dir = tmp_path / "products" / "test_product" / "flows"
     flows_dir.mkdir(parents=True, exist_ok=True)
     flow_path = flows_dir / "test_flow.yaml"
-    flow_path.write_text(
-        "\n".join(
-            [
-                'id: "test_flow"',
-                'version: "1.0.0"',
-                "steps:",
-                '  - id: "run_tool"',
-                '    type: "tool"',
-                '    backend: "local"',
-                f'    tool: "{tool_name}"',
-                "    params: {}",
-                "",
-            ]
-        ),
-        encoding="utf-8",
-    )
+    flow_path.write_bytes(_FLOW_YAML_TEMPLATE.format(tool_name=tool_name).encode("utf-8"))
     return flow_path
 
 
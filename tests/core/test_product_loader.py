@@ -34,9 +34,9 @@ def _write_product(root: Path, name: str, *, with_registry: bool = True) -> None
     prod_dir = root / "products" / name
     (prod_dir / "flows").mkdir(parents=True, exist_ok=True)
     (prod_dir / "config").mkdir(parents=True, exist_ok=True)
-    (prod_dir / "__init__.py").write_text("", encoding="utf-8")
+    (prod_dir / "__init__.py").write_bytes(b"")
 
-    (prod_dir / "flows" / "flow_one.yaml").write_text("id: flow_one", encoding="utf-8")
+    (prod_dir / "flows" / "flow_one.yaml").write_bytes(b"id: flow_one")
 
     manifest = textwrap.dedent(
         f"""
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+# ==============================
+# Settings Cache Tests
+# ==============================
+
+from core.config import loader
+from core.config.loader import clear_caches, load_settings
+
+
+def _write_configs(root, *, port: int) -> None:
+    configs = root / "configs"
+    configs.mkdir(parents=True, exist_ok=True)
+    (configs / "app.yaml").write_text(f"app:\n  port: {port}\n", encoding="utf-8")
+    for name in ("models", "policies", "logging", "products"):
+        (configs / f"{name}.yaml").write_text(f"{name}: {{}}\n", encoding="utf-8")
+
+
+def test_repeat_loads_hit_cache_and_return_fresh_copies(tmp_path):
+    _write_configs(tmp_path, port=1111)
+    clear_caches()
+
+    first = load_settings(repo_root=str(tmp_path), env={"UNRELATED": "a"})
+    first.policies.blocked_tools = ["echo_tool"]
+    second = load_settings(repo_root=str(tmp_path), env={"UNRELATED": "b"})
+
+    assert loader._load_validated.cache_info().hits == 1
+    assert second is not first
+    assert second.policies.blocked_tools == []
+
+
+def test_env_override_and_file_edit_miss_cache(tmp_path):
+    _write_configs(tmp_path, port=1111)
+    clear_caches()
+
+    assert load_settings(repo_root=str(tmp_path), env={}).app.port == 1111
+    assert load_settings(repo_root=str(tmp_path), env={"MASTER__APP__PORT": "2222"}).app.port == 2222
+
+    _write_configs(tmp_path, port=33333)
+    assert load_settings(repo_root=str(tmp_path), env={}).app.port == 33333
+    assert loader._load_validated.cache_info().hits == 0
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+# ==============================
+# Tests: SQLite pragma validation
+# ==============================
+
+from pathlib import Path
+
+import pytest
+
+from core.knowledge.vector_store import SqliteVectorStore
+from core.memory.sqlite_backend import SQLiteBackend
+from core.utils.sqlite_pragmas import validate_pragmas
+
+
+def test_validate_pragmas_accepts_keywords_and_integers() -> None:
+    assert validate_pragmas({"synchronous": "OFF", "cache_size": -2000, "temp_store": "MEMORY"}) == {
+        "synchronous": "OFF",
+        "cache_size": "-2000",
+        "temp_store": "MEMORY",
+    }
+
+
+@pytest.mark.parametrize(
+    "pragmas",
+    [
+        {"synchronous; DROP TABLE runs": "OFF"},
+        {"Synchronous": "OFF"},
+        {"synchronous": "OFF; DROP TABLE runs"},
+        {"synchronous": "'off'"},
+        {"synchronous": True},
+        {"cache_size": 1.5},
+    ],
+)
+def test_stores_reject_non_literal_pragmas(tmp_path: Path, pragmas: dict) -> None:
+    with pytest.raises(ValueError):
+        SQLiteBackend(db_path=str(tmp_path / "memory.sqlite"), pragmas=pragmas)
+    with pytest.raises(ValueError):
+        SqliteVectorStore(str(tmp_path / "vectors.sqlite"), pragmas=pragmas)
@@ -47,6 +47,17 @@ def test_tool_registry_registers_and_resolves() -> None:
     assert isinstance(resolved, EchoTool)
 
 
+def test_tool_registry_overlay_shadows_and_restores() -> None:
+    ToolRegistry.clear()
+    ToolRegistry.register("echo_tool", lambda: EchoTool())
+    with ToolRegistry.overlay("echo_tool", lambda: RecordingTool()):
+        assert isinstance(ToolRegistry.resolve("echo_tool"), RecordingTool)
+        assert ToolRegistry.has("echo_tool")
+    resolved = ToolRegistry.resolve("echo_tool")
+    assert type(resolved) is EchoTool
+    assert len(ToolRegistry._tools.maps) == 1
+
+
 def test_tool_executor_runs_tool_and_redacts_traces() -> None:
     ToolRegistry.clear()
     settings = Settings()
@@ -97,3 +108,24 @@ def test_tool_executor_blocks_denied_tool_without_running_code() -> None:
     assert result.ok is False
     assert tools and tools[0].calls == 0
     assert any(event == "governance.decision" for event, _ in events)
+
+
+def test_tool_registry_snapshot_restore_round_trips_base_registrations() -> None:
+    ToolRegistry.clear()
+    ToolRegistry.register("echo_tool", lambda: EchoTool())
+    saved = ToolRegistry.snapshot()
+    ToolRegistry.clear()
+    with ToolRegistry.overlay("echo_tool", lambda: RecordingTool()):
+        ToolRegistry.restore(saved)
+        assert isinstance(ToolRegistry.resolve("echo_tool"), RecordingTool)
+    assert type(ToolRegistry.resolve("echo_tool")) is EchoTool
+    ToolRegistry.clear()
+
+
+def test_tool_registry_register_and_clear_inside_overlay_touch_only_base() -> None:
+    ToolRegistry.clear()
+    with ToolRegistry.overlay("echo_tool", lambda: RecordingTool()):
+        ToolRegistry.register("echo_tool", lambda: EchoTool())
+        ToolRegistry.clear()
+        assert isinstance(ToolRegistry.resolve("echo_tool"), RecordingTool)
+    assert not ToolRegistry.has("echo_tool")
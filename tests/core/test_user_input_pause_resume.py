@@ -4,7 +4,9 @@ from __future__ import annotations
 # Tests: User Input Pause/Resume
 # ==============================
 
+import functools
 from pathlib import Path
+from typing import Callable, Tuple
 
 import pytest
 
@@ -33,51 +35,44 @@ class _EchoTool(BaseTool):
         return ToolResult.ok(data={"summary": "ok", "details": params}, meta=meta)
 
 
-def _write_flow(tmp_path: Path) -> Path:
-    flows_dir = tmp_path / "products" / "test_product" / "flows"
-    flows_dir.mkdir(parents=True, exist_ok=True)
-    flow_path = flows_dir / "test_flow.yaml"
-    flow_path.write_text(
-        "\n".join(
-            [
-                'id: "test_flow"',
-                'version: "1.0.0"',
-                "steps:",
-                '  - id: "input"',
-                '    type: "user_input"',
-                "    params:",
-                '      schema_version: "1.0"',
-                '      form_id: "notes"',
-                '      prompt: "Notes"',
-                '      input_type: "text"',
-                '      mode: "free_text_input"',
-                "      schema:",
-                '        type: "object"',
-                "        properties:",
-                "          text:",
-                '            type: "string"',
-                "      required:",
-                '        - "text"',
-                '  - id: "echo"',
-                '    type: "tool"',
-                '    backend: "local"',
-                '    tool: "echo_tool"',
-                "    params:",
-                '      text: "{{artifacts.user_input.notes.values.text}}"',
-                "",
-            ]
-        ),
-        encoding="utf-8",
-    )
-    return flow_path
+_FLOW = {
+    "id": "test_flow",
+    "version": "1.0.0",
+    "steps": [
+        {
+            "id": "input",
+            "type": "user_input",
+            "params": {
+                "schema_version": "1.0",
+                "form_id": "notes",
+                "prompt": "Notes",
+                "input_type": "text",
+                "mode": "free_text_input",
+                "schema": {"type": "object", "properties": {"text": {"type": "string"}}},
+                "required": ["text"],
+            },
+        },
+        {
+            "id": "echo",
+            "type": "tool",
+            "backend": "local",
+            "tool": "echo_tool",
+            "params": {"text": "{{artifacts.user_input.notes.values.text}}"},
+        },
+    ],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_settings() -> Settings:
+    return Settings()
 
 
 def _build_engine(tmp_path: Path, *, settings: Settings | None = None) -> OrchestratorEngine:
-    flow_path = _write_flow(tmp_path)
-    flow_loader = FlowLoader(products_root=flow_path.parents[2])
+    flow_loader = FlowLoader.from_mapping({"test_product": {"test_flow": _FLOW}}, products_root=tmp_path / "products")
     memory = MemoryRouter(backend=InMemoryBackend())
     tracer = Tracer(memory=memory, mirror_to_log=False)
-    settings = settings or Settings()
+    settings = settings or _default_settings()
     governance = GovernanceHooks(settings=settings)
     tool_executor = ToolExecutor(registry=ToolRegistry, hooks=governance, redactor=SecurityRedactor())
     step_executor = StepExecutor(tool_executor=tool_executor, governance=governance, agent_registry=AgentRegistry)
@@ -90,12 +85,24 @@ def _build_engine(tmp_path: Path, *, settings: Settings | None = None) -> Orches
     )
 
 
-def test_user_input_pause_and_resume(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def user_input_engine(tmp_path_factory: pytest.TempPathFactory) -> Tuple[OrchestratorEngine, Callable[[], None]]:
+    """Engine shared by the default-settings tests; reset() empties run storage in place and re-registers echo_tool."""
+    engine = _build_engine(tmp_path_factory.mktemp("user_input"))
+
+    def reset() -> None:
+        engine.memory.reset()
+        ToolRegistry.register("echo_tool", _EchoTool, overwrite=True)
+
+    return engine, reset
+
+
+def test_user_input_pause_and_resume(user_input_engine: Tuple[OrchestratorEngine, Callable[[], None]]) -> None:
+    engine, reset = user_input_engine
     AgentRegistry.clear()
     ToolRegistry.clear()
     try:
-        ToolRegistry.register("echo_tool", lambda: _EchoTool())
-        engine = _build_engine(tmp_path)
+        reset()
 
         started = engine.run_flow(product="test_product", flow="test_flow", payload={})
         assert started.ok, started.error
@@ -125,12 +132,12 @@ def test_user_input_pause_and_resume(tmp_path: Path) -> None:
         ToolRegistry.clear()
 
 
-def test_user_input_invalid_response_rejected(tmp_path: Path) -> None:
+def test_user_input_invalid_response_rejected(user_input_engine: Tuple[OrchestratorEngine, Callable[[], None]]) -> None:
+    engine, reset = user_input_engine
     AgentRegistry.clear()
     ToolRegistry.clear()
     try:
-        ToolRegistry.register("echo_tool", lambda: _EchoTool())
-        engine = _build_engine(tmp_path)
+        reset()
 
         started = engine.run_flow(product="test_product", flow="test_flow", payload={})
         assert started.ok, started.error
@@ -158,7 +165,7 @@ def test_user_input_payload_limit_blocked(tmp_path: Path) -> None:
     AgentRegistry.clear()
     ToolRegistry.clear()
     try:
-        ToolRegistry.register("echo_tool", lambda: _EchoTool())
+        ToolRegistry.register("echo_tool", _EchoTool)
         settings = Settings(policies=PoliciesConfig(max_payload_bytes=50))
         engine = _build_engine(tmp_path, settings=settings)
 
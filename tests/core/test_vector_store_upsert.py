@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+# ==============================
+# Tests: SqliteVectorStore batched upsert
+# ==============================
+
+from pathlib import Path
+
+from core.knowledge.base import IngestChunk, Query
+from core.knowledge.vector_store import SqliteVectorStore
+
+_EPHEMERAL_PRAGMAS = {"synchronous": "OFF", "temp_store": "MEMORY"}
+
+
+def _chunk(doc_id: str, chunk_id: str, text: str) -> IngestChunk:
+    return IngestChunk(doc_id=doc_id, chunk_id=chunk_id, text=text, source=f"{doc_id}.txt")
+
+
+def test_upsert_counts_inserts_and_updates(tmp_path: Path) -> None:
+    store = SqliteVectorStore(str(tmp_path / "vectors" / "knowledge.sqlite"), pragmas=_EPHEMERAL_PRAGMAS)
+
+    first = store.upsert([_chunk("doc1", "c1", "alpha beta"), _chunk("doc1", "c2", "gamma")])
+    assert first.ok
+    assert (first.inserted, first.updated) == (2, 0)
+
+    second = store.upsert([_chunk("doc1", "c1", "alpha delta"), _chunk("doc2", "c1", "beta")])
+    assert second.ok
+    assert (second.inserted, second.updated) == (1, 1)
+    assert store.stats().total_chunks == 3
+
+    hits = store.query(Query(text="delta"))
+    assert [hit.text for hit in hits] == ["alpha delta"]
+
+
+def test_upsert_duplicate_keys_in_one_batch_count_as_update(tmp_path: Path) -> None:
+    store = SqliteVectorStore(str(tmp_path / "knowledge.sqlite"), pragmas=_EPHEMERAL_PRAGMAS)
+    result = store.upsert([_chunk("doc1", "c1", "first"), _chunk("doc1", "c1", "second")])
+    assert result.ok
+    assert (result.inserted, result.updated) == (1, 1)
+    assert store.stats().total_chunks == 1
+
+
+def test_upsert_bad_row_fails_alone(tmp_path: Path) -> None:
+    store = SqliteVectorStore(str(tmp_path / "knowledge.sqlite"), pragmas=_EPHEMERAL_PRAGMAS)
+    # text is NOT NULL in the table; model_construct skips validation so the row reaches sqlite.
+    bad = IngestChunk.model_construct(**{**_chunk("doc1", "c2", "x").model_dump(), "text": None})
+    result = store.upsert([_chunk("doc1", "c1", "alpha"), bad, _chunk("doc2", "c1", "beta")])
+    assert not result.ok
+    assert len(result.errors) == 1
+    assert (result.inserted, result.updated) == (2, 0)
+    assert store.stats().total_chunks == 2
@@ -9,32 +9,40 @@ from typing import Iterable, List
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
+REPO_ROOT_STR = str(REPO_ROOT)
 OUTPUT_DIR = REPO_ROOT / "docs" / "components"
 EXTENSIONS = {".py", ".yaml", ".yml"}
 EXCLUDE_DIRS: set[str] = set()
 EXCLUDE_FILES: set[str] = {".DS_Store"}
 
 
-def _iter_components(root: Path) -> Iterable[Path]:
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.name in EXCLUDE_FILES:
-            continue
-        if path.parent == root:
-            yield path
+def _iter_components(root: str) -> Iterable[str]:
+    # Plain str paths from DirEntry; Path objects are only built when a file is opened.
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
             continue
-        if path.suffix.lower() in EXTENSIONS:
-            yield path
-
-
-def _top_level_dir(path: Path) -> str:
-    rel = path.relative_to(REPO_ROOT)
-    parts = rel.parts
+        with entries:
+            for entry in entries:
+                # Symlinked directories are not descended into (as with rglob), so a link loop cannot recurse.
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file() or entry.name in EXCLUDE_FILES:
+                    continue
+                if current == root or os.path.splitext(entry.name)[1].lower() in EXTENSIONS:
+                    yield entry.path
+
+
+def _top_level_dir(path: str) -> str:
+    parts = os.path.relpath(path, REPO_ROOT_STR).split(os.sep, 1)
     return parts[0] if len(parts) > 1 else "root"
 
 
-def _write_bundle(name: str, files: List[Path]) -> None:
+def _write_bundle(name: str, files: List[str]) -> None:
     if not files:
         return
     output_path = OUTPUT_DIR / f"{name}.txt"
@@ -42,16 +50,17 @@ def _write_bundle(name: str, files: List[Path]) -> None:
     lines: List[str] = []
     lines.append(f"# captured_at: {timestamp}")
     lines.append("")
-    for file_path in sorted(files):
-        rel = file_path.relative_to(REPO_ROOT)
+    for path_str in sorted(files, key=lambda p: p.split(os.sep)):
+        rel = os.path.relpath(path_str, REPO_ROOT_STR)
         lines.append(f"# {rel}")
+        file_path = Path(path_str)
         try:
             content = file_path.read_text(encoding="utf-8")
         except Exception:
             content = file_path.read_text(encoding="utf-8", errors="replace")
         if "\x00" in content:
             continue
-        if _is_secrets_path(file_path):
+        if _is_secrets_path(rel):
             content = _redact_secrets(content)
         lines.append(content.rstrip())
         lines.append("")
@@ -62,8 +71,8 @@ def _timestamp() -> str:
     return datetime.now(tz=timezone.utc).isoformat()
 
 
-def _is_secrets_path(path: Path) -> bool:
-    return "secrets" in path.parts
+def _is_secrets_path(path: str) -> bool:
+    return "secrets" in path.split(os.sep)
 
 
 def _redact_secrets(content: str) -> str:
@@ -80,8 +89,8 @@ def _redact_secrets(content: str) -> str:
 
 def main() -> None:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    bundles: dict[str, List[Path]] = {}
-    for component in _iter_components(REPO_ROOT):
+    bundles: dict[str, List[str]] = {}
+    for component in _iter_components(REPO_ROOT_STR):
         top = _top_level_dir(component)
         if not top or top.startswith(".") or top in EXCLUDE_DIRS:
             continue
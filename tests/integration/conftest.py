@@ -3,25 +3,82 @@ from __future__ import annotations
 # ==============================
 # Integration fixtures
 
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Iterator, Tuple
 
 import pytest
 
+from core.agents.registry import AgentRegistration, AgentRegistry
+from core.config.loader import load_settings
+from core.config.schema import Settings
+from core.memory.router import MemoryRouter
+from core.memory.sqlite_backend import SQLiteBackend
+from core.tools.registry import ToolRegistration, ToolRegistry
+from core.utils.product_loader import ProductCatalog, discover_products, register_enabled_products
 
-@pytest.fixture
-def hello_world_test_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@contextmanager
+def registry_snapshot(
+    agents: Dict[str, AgentRegistration],
+    tools: Dict[str, ToolRegistration],
+) -> Iterator[None]:
+    """Install saved agent/tool registrations for the block, then restore the previous contents."""
+    saved_agents = AgentRegistry.snapshot()
+    saved_tools = ToolRegistry.snapshot()
+    AgentRegistry.restore(agents)
+    ToolRegistry.restore(tools)
+    try:
+        yield
+    finally:
+        AgentRegistry.restore(saved_agents)
+        ToolRegistry.restore(saved_tools)
+
+
+@pytest.fixture(scope="session")
+def bootstrapped_products(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Tuple[Settings, ProductCatalog, Dict[str, AgentRegistration], Dict[str, ToolRegistration]]:
     """
-    Shared env fixture for integration tests that rely on sqlite-backed memory.
+    Load settings, discover products, and register them once per session.
 
-    This fixture ensures we use deterministic sqlite paths (for runs, approvals, and
-    ingestion) without duplicating environment overrides in every test.
+    Storage and the sqlite DB path point at a session tmp dir, never the repo's storage/.
+    Returns the settings, the catalog, and snapshots of the resulting agent/tool
+    registrations so per-test fixtures can reinstall them without re-running discovery.
     """
-    repo_root = Path(__file__).resolve().parents[2]
-    storage_dir = tmp_path / "storage"
-    sqlite_path = tmp_path / "integration.sqlite"
+    session_root = tmp_path_factory.mktemp("integration")
+    settings = load_settings(
+        repo_root=str(REPO_ROOT),
+        configs_dir=str(REPO_ROOT / "configs"),
+        env={
+            "MASTER__APP__PATHS__REPO_ROOT": REPO_ROOT.as_posix(),
+            "MASTER__APP__PATHS__STORAGE_DIR": (session_root / "storage").as_posix(),
+            "MASTER__SECRETS__MEMORY_DB_PATH": (session_root / "integration.sqlite").as_posix(),
+        },
+    )
+    catalog = discover_products(settings, repo_root=REPO_ROOT)
+    with registry_snapshot({}, {}):
+        register_enabled_products(catalog, settings=settings)
+        agents = AgentRegistry.snapshot()
+        tools = ToolRegistry.snapshot()
+    return settings, catalog, agents, tools
 
-    monkeypatch.setenv("MASTER__APP__PATHS__REPO_ROOT", repo_root.as_posix())
-    monkeypatch.setenv("MASTER__APP__PATHS__STORAGE_DIR", storage_dir.as_posix())
-    monkeypatch.setenv("MASTER__SECRETS__MEMORY_DB_PATH", sqlite_path.as_posix())
 
-    return sqlite_path
+@pytest.fixture
+def registered_products(
+    bootstrapped_products: Tuple[Settings, ProductCatalog, Dict[str, AgentRegistration], Dict[str, ToolRegistration]],
+) -> Iterator[Tuple[Settings, ProductCatalog]]:
+    """Per-test view of the session bootstrap with registries restored afterwards."""
+    settings, catalog, agents, tools = bootstrapped_products
+    with registry_snapshot(agents, tools):
+        yield settings, catalog
+
+
+@pytest.fixture
+def sqlite_memory(tmp_path: Path) -> MemoryRouter:
+    """Fresh sqlite-backed memory router rooted under tmp_path."""
+    backend = SQLiteBackend(db_path=(tmp_path / "integration.sqlite").as_posix())
+    backend.ensure_schema()
+    return MemoryRouter(backend, repo_root=REPO_ROOT, observability_root=tmp_path / "observability")
@@ -30,6 +30,7 @@ def test_cli_run_resume_flow(tmp_path, monkeypatch, capsys) -> None:
     sqlite_path = tmp_path / "cli.sqlite"
     monkeypatch.setenv("MASTER__APP__PATHS__REPO_ROOT", repo_root.as_posix())
     monkeypatch.setenv("MASTER__APP__PATHS__STORAGE_DIR", storage_dir.as_posix())
+    monkeypatch.setenv("MASTER__APP__PATHS__OBSERVABILITY_DIR", (tmp_path / "observability").as_posix())
     monkeypatch.setenv("MASTER__SECRETS__MEMORY_DB_PATH", sqlite_path.as_posix())
 
     AgentRegistry.clear()
@@ -98,6 +99,7 @@ def test_cli_resume_rejection_marks_failed(tmp_path, monkeypatch, capsys) -> Non
     sqlite_path = tmp_path / "cli.sqlite"
     monkeypatch.setenv("MASTER__APP__PATHS__REPO_ROOT", repo_root.as_posix())
     monkeypatch.setenv("MASTER__APP__PATHS__STORAGE_DIR", storage_dir.as_posix())
+    monkeypatch.setenv("MASTER__APP__PATHS__OBSERVABILITY_DIR", (tmp_path / "observability").as_posix())
     monkeypatch.setenv("MASTER__SECRETS__MEMORY_DB_PATH", sqlite_path.as_posix())
 
     AgentRegistry.clear()
@@ -148,6 +150,7 @@ def test_cli_resume_missing_payload_fails(tmp_path, monkeypatch, capsys) -> None
     sqlite_path = tmp_path / "cli.sqlite"
     monkeypatch.setenv("MASTER__APP__PATHS__REPO_ROOT", repo_root.as_posix())
     monkeypatch.setenv("MASTER__APP__PATHS__STORAGE_DIR", storage_dir.as_posix())
+    monkeypatch.setenv("MASTER__APP__PATHS__OBSERVABILITY_DIR", (tmp_path / "observability").as_posix())
     monkeypatch.setenv("MASTER__SECRETS__MEMORY_DB_PATH", sqlite_path.as_posix())
 
     AgentRegistry.clear()
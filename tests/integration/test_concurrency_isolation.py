@@ -31,26 +31,29 @@ def _run_and_finish(orchestrator, trace_sink) -> str:
     return run_id
 
 
-def test_concurrent_runs_isolated(orchestrator, trace_sink) -> None:
+def test_concurrent_runs_isolated(orchestrator, trace_sink, shared_executor: ThreadPoolExecutor) -> None:
     _register_products()
-    executor = ThreadPoolExecutor(max_workers=3)
-    futures = [executor.submit(_run_and_finish, orchestrator, trace_sink) for _ in range(3)]
+    futures = [shared_executor.submit(_run_and_finish, orchestrator, trace_sink) for _ in range(3)]
     run_ids = [f.result() for f in futures]
-    executor.shutdown()
 
     memory = orchestrator.memory  # type: ignore[assignment]
-    for run_id in run_ids:
-        bundle = memory.get_run(run_id)
+    bundles = {run_id: memory.get_run(run_id) for run_id in run_ids}
+    for run_id, bundle in bundles.items():
         assert bundle is not None
         assert bundle.run.run_id == run_id
         assert bundle.run.status == "COMPLETED"
 
-    trace_runs = {event["run_id"] for event in trace_sink}
+    # Single pass over the sink: bucket events per run and record every run_id seen.
+    run_steps: Dict[str, List[Dict]] = {run_id: [] for run_id in run_ids}
+    trace_runs = set()
+    for event in trace_sink:
+        trace_runs.add(event["run_id"])
+        events = run_steps.get(event["run_id"])
+        if events is not None:
+            events.append(event)
     assert set(run_ids) == trace_runs
-    assert all(run_id in trace_runs for run_id in run_ids)
 
     # Shared fixture sanity: each run_id has its own entries, no cross-run leaks
-    run_steps = {run_id: [e for e in trace_sink if e["run_id"] == run_id] for run_id in run_ids}
     for run_id, events in run_steps.items():
         assert all(event["run_id"] == run_id for event in events)
         assert events, "Expected trace events per run"
@@ -4,7 +4,6 @@ from __future__ import annotations
 # Integration: Observability Artifacts
 # ==============================
 
-import json
 from pathlib import Path
 
 from core.agents.registry import AgentRegistry
@@ -22,6 +21,11 @@ from core.tools.base import BaseTool
 from core.tools.executor import ToolExecutor
 from core.tools.registry import ToolRegistry
 
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - optional accelerator
+    from json import loads as _loads
+
 
 class _EchoTool(BaseTool):
     name = "echo_tool"
@@ -31,45 +35,43 @@ class _EchoTool(BaseTool):
         return ToolResult(ok=True, data={"summary": "ok", "details": params}, error=None, meta=meta)
 
 
+_FLOW_YAML = """\
+id: "test_flow"
+version: "1.0.0"
+steps:
+  - id: "input"
+    type: "user_input"
+    params:
+      schema_version: "1.0"
+      form_id: "notes"
+      prompt: "Notes"
+      input_type: "select"
+      mode: "choice_input"
+      schema:
+        type: "object"
+        properties:
+          selection:
+            type: "string"
+            enum:
+              - "alpha"
+              - "beta"
+      required:
+        - "selection"
+  - id: "echo"
+    type: "tool"
+    backend: "local"
+    tool: "echo_tool"
+    params:
+      text: "{{artifacts.user_input.notes.values.selection}}"
+"""
+_FLOW_YAML_BYTES = _FLOW_YAML.encode("utf-8")
+
+
 def _write_flow(tmp_path: Path) -> Path:
     flows_dir = tmp_path / "products" / "test_product" / "flows"
     flows_dir.mkdir(parents=True, exist_ok=True)
     flow_path = flows_dir / "test_flow.yaml"
-    flow_path.write_text(
-        "\n".join(
-            [
-                'id: "test_flow"',
-                'version: "1.0.0"',
-                "steps:",
-                '  - id: "input"',
-                '    type: "user_input"',
-                "    params:",
-                '      schema_version: "1.0"',
-                '      form_id: "notes"',
-                '      prompt: "Notes"',
-                '      input_type: "select"',
-                '      mode: "choice_input"',
-                "      schema:",
-                '        type: "object"',
-                "        properties:",
-                "          selection:",
-                '            type: "string"',
-                "            enum:",
-                '              - "alpha"',
-                '              - "beta"',
-                "      required:",
-                '        - "selection"',
-                '  - id: "echo"',
-                '    type: "tool"',
-                '    backend: "local"',
-                '    tool: "echo_tool"',
-                "    params:",
-                '      text: "{{artifacts.user_input.notes.values.selection}}"',
-                "",
-            ]
-        ),
-        encoding="utf-8",
-    )
+    flow_path.write_bytes(_FLOW_YAML_BYTES)
     return flow_path
 
 
@@ -114,12 +116,12 @@ def test_observability_artifacts_written(tmp_path: Path) -> None:
         assert output_dir.exists()
         assert (output_dir / "response.json").exists()
 
-        response = json.loads((output_dir / "response.json").read_text(encoding="utf-8"))
+        response = _loads((output_dir / "response.json").read_bytes())
         assert response.get("status") == "PAUSED_WAITING_FOR_USER"
 
-        events_text = (runtime_dir / "events.jsonl").read_text(encoding="utf-8")
-        assert "pending_user_input" in events_text
-        assert "run_paused" in events_text
+        events_bytes = (runtime_dir / "events.jsonl").read_bytes()
+        assert b"pending_user_input" in events_bytes
+        assert b"run_paused" in events_bytes
 
         resumed = engine.resume_run(
             run_id=run_id,
@@ -127,7 +129,7 @@ def test_observability_artifacts_written(tmp_path: Path) -> None:
         )
         assert resumed.ok, resumed.error
 
-        response = json.loads((output_dir / "response.json").read_text(encoding="utf-8"))
+        response = _loads((output_dir / "response.json").read_bytes())
         assert response.get("status") == "COMPLETED"
     finally:
         AgentRegistry.clear()
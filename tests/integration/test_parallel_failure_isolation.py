@@ -4,15 +4,15 @@ from __future__ import annotations
 # Parallel Failure Isolation
 # ==============================
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List
 
 from core.agents.registry import AgentRegistry
 from core.config.loader import load_settings
 from core.contracts.tool_schema import ToolError, ToolErrorCode, ToolMeta, ToolResult
 from core.memory.router import MemoryRouter
 from core.tools.base import BaseTool
-from core.tools.registry import ToolRegistry, ToolRegistration
+from core.tools.registry import ToolRegistry
 from core.utils.product_loader import discover_products, register_enabled_products
 
 
@@ -41,37 +41,23 @@ class PayloadDrivenTool(BaseTool):
         return ToolResult(ok=True, data={"echo": params.get("message", "")}, error=None, meta=meta)
 
 
-def _override_echo(tool_cls) -> ToolRegistration | None:
-    original = ToolRegistry._tools.get("echo_tool")
-    ToolRegistry.register("echo_tool", tool_cls, overwrite=True)
-    return original
-
-
-def _restore_echo(registration: ToolRegistration | None) -> None:
-    if registration:
-        ToolRegistry._tools["echo_tool"] = registration
-    else:
-        ToolRegistry._tools.pop("echo_tool", None)
-
-
-def test_parallel_failure_isolation(orchestrator, trace_sink: List[Dict[str, str]]) -> None:
+def test_parallel_failure_isolation(orchestrator, trace_sink, shared_executor: ThreadPoolExecutor) -> None:
     _register_products()
-    original = _override_echo(lambda: PayloadDrivenTool())
-    try:
+    with ToolRegistry.overlay("echo_tool", lambda: PayloadDrivenTool()):
         def run_task(marker: str, fail: bool):
             payload = {"keyword": f"run-{marker}", "fail_run": fail}
             res = orchestrator.run_flow(product="hello_world", flow="hello_world", payload=payload)
             return res.data["run_id"], fail
 
-        results = []
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(run_task, "a", False),
-                executor.submit(run_task, "b", False),
-                executor.submit(run_task, "c", True),
-            ]
-            for future in futures:
-                results.append(future.result())
+        async def run_all():
+            # One event loop fans out; the session's pre-warmed pool runs the synchronous run_flow calls.
+            loop = asyncio.get_running_loop()
+            cases = [("a", False), ("b", False), ("c", True)]
+            return await asyncio.gather(
+                *(loop.run_in_executor(shared_executor, run_task, marker, fail) for marker, fail in cases)
+            )
+
+        results = asyncio.run(run_all())
 
         memory = orchestrator.memory  # type: ignore[assignment]
         failed_runs = []
@@ -91,17 +77,15 @@ def test_parallel_failure_isolation(orchestrator, trace_sink: List[Dict[str, str
         assert len(failed_runs) == 1
         assert len(success_runs) == 2
 
-        failure_events = [event for event in trace_sink if event["run_id"] in failed_runs]
+        failed_set = frozenset(failed_runs)
+        success_set = frozenset(success_runs)
+
+        failure_events = [event for run_id in failed_set for event in trace_sink.by_run[run_id]]
         assert failure_events, f"No trace events for failed runs: {failed_runs}"
-        assert any(event["kind"] == "tool_call_attempt_failed" for event in failure_events), f"Events: {[e['kind'] for e in failure_events]}"
-        assert all(
-            event["run_id"] in failed_runs
-            for event in failure_events
-            if event["kind"] == "tool_call_attempt_failed"
-        )
-
-        success_events = [event for event in trace_sink if event["run_id"] in success_runs]
-        assert all(event["kind"] != "step_failed" for event in success_events)
+        attempt_failed = trace_sink.by_kind["tool_call_attempt_failed"]
+        assert attempt_failed, f"Events: {[e['kind'] for e in failure_events]}"
+        assert all(event["run_id"] in failed_set for event in attempt_failed)
+
+        success_events = [event for run_id in success_set for event in trace_sink.by_run[run_id]]
         assert success_events
-    finally:
-        _restore_echo(original)
+        assert not any(event["run_id"] in success_set for event in trace_sink.by_kind["step_failed"])
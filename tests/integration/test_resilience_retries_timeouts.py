@@ -4,37 +4,39 @@ from __future__ import annotations
 # Resilience: Retries & Timeouts
 # ==============================
 
-from typing import Dict, List, Type
+import copy
+import functools
+from typing import Any, Dict, List, Tuple
 
 from core.agents.registry import AgentRegistry
 from core.config.loader import load_settings
+from core.config.schema import Settings
 from core.contracts.run_schema import RunStatus
 from core.contracts.tool_schema import ToolError, ToolErrorCode, ToolMeta, ToolResult
 from core.tools.base import BaseTool
-from core.tools.registry import ToolRegistry, ToolRegistration
-from core.utils.product_loader import discover_products, register_enabled_products
+from core.tools.registry import ToolRegistry
+from core.utils.product_loader import ProductCatalog, discover_products, register_enabled_products
 
 
-def _register_products():
+@functools.lru_cache(maxsize=None)
+def _read_products() -> Tuple[Settings, ProductCatalog]:
     settings = load_settings()
-    AgentRegistry.clear()
-    ToolRegistry.clear()
-    catalog = discover_products(settings)
-    register_enabled_products(catalog, settings=settings)
-    return settings
+    return settings, discover_products(settings)
 
 
-def _override_echo_tool(factory_cls: Type[BaseTool]) -> ToolRegistration | None:
-    reg = ToolRegistry._tools.get("echo_tool")
-    ToolRegistry.register("echo_tool", lambda: factory_cls(), overwrite=True)
-    return reg
+def _load_products() -> Tuple[Settings, ProductCatalog]:
+    # Read from disk once per module, but hand each test its own copies so no mutation leaks across tests.
+    settings, catalog = _read_products()
+    return settings.model_copy(deep=True), copy.deepcopy(catalog)
 
 
-def _restore_echo_tool(registration: ToolRegistration | None) -> None:
-    if registration:
-        ToolRegistry._tools["echo_tool"] = registration
-    else:
-        ToolRegistry._tools.pop("echo_tool", None)
+def _register_products() -> Settings:
+    # Registries are still rebuilt per test.
+    settings, catalog = _load_products()
+    AgentRegistry.clear()
+    ToolRegistry.clear()
+    register_enabled_products(catalog, settings=settings)
+    return settings
 
 
 class BackendBehaviorTool(BaseTool):
@@ -71,8 +73,7 @@ class BackendBehaviorTool(BaseTool):
 def test_retry_success(orchestrator, trace_sink: List[Dict[str, Any]]) -> None:
     _register_products()
     state: Dict = {}
-    original = _override_echo_tool(lambda: BackendBehaviorTool(behavior="fail_once_then_success", state=state))
-    try:
+    with ToolRegistry.overlay("echo_tool", lambda: BackendBehaviorTool(behavior="fail_once_then_success", state=state)):
         result = orchestrator.run_flow(product="hello_world", flow="hello_world", payload={"keyword": "retry"})
         assert result.ok, result.error
         assert state, "Tool attempts recorded"
@@ -89,15 +90,12 @@ def test_retry_success(orchestrator, trace_sink: List[Dict[str, Any]]) -> None:
         run = orchestrator.get_run(run_id=result.data["run_id"])
         assert run.ok
         assert run.data["run"]["status"] == RunStatus.COMPLETED.value
-    finally:
-        _restore_echo_tool(original)
 
 
 def test_timeout_exhaustion(orchestrator, trace_sink: List[Dict[str, Any]]) -> None:
     _register_products()
     state: Dict = {}
-    original = _override_echo_tool(lambda: BackendBehaviorTool(behavior="always_timeout", state=state))
-    try:
+    with ToolRegistry.overlay("echo_tool", lambda: BackendBehaviorTool(behavior="always_timeout", state=state)):
         result = orchestrator.run_flow(product="hello_world", flow="hello_world", payload={"keyword": "timeout"})
         assert result.ok
         assert state, "Timeout attempts recorded"
@@ -112,5 +110,3 @@ def test_timeout_exhaustion(orchestrator, trace_sink: List[Dict[str, Any]]) -> N
         run = orchestrator.get_run(run_id=result.data["run_id"])
         assert run.ok
         assert run.data["run"]["status"] == RunStatus.FAILED.value
-    finally:
-        _restore_echo_tool(original)
@@ -28,7 +28,11 @@ def test_concurrent_runs_isolated(tmp_path) -> None:
         "MASTER__SECRETS__MEMORY_DB_PATH": sqlite_path.as_posix(),
     }
     settings = load_settings(repo_root=str(repo_root), env=env)
-    backend = SQLiteBackend(db_path=sqlite_path.as_posix())
+    # Throwaway DB: skip fsyncs; WAL stays on for the concurrent writers.
+    backend = SQLiteBackend(
+        db_path=sqlite_path.as_posix(),
+        pragmas={"synchronous": "OFF", "temp_store": "MEMORY"},
+    )
     backend.ensure_schema()
     memory = MemoryRouter(backend, repo_root=None)
     tracer = Tracer.from_settings(settings=settings, memory=memory)
@@ -4,27 +4,19 @@ from __future__ import annotations
 # Integration: Minimal Smoke Test
 # ==============================
 
-from pathlib import Path
+from typing import Tuple
 
-from core.config.loader import load_settings
+from core.config.schema import Settings
+from core.memory.router import MemoryRouter
 from core.orchestrator.engine import OrchestratorEngine
-from core.utils.product_loader import discover_products, register_enabled_products
+from core.utils.product_loader import ProductCatalog
 
 
-def test_smoke_engine_init(tmp_path: Path) -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    sqlite_path = tmp_path / "smoke.sqlite"
-    storage_dir = tmp_path / "storage"
-
-    settings = load_settings(
-        repo_root=str(repo_root),
-        configs_dir=str(repo_root / "configs"),
-        env={
-            "MASTER__APP__PATHS__STORAGE_DIR": storage_dir.as_posix(),
-            "MASTER__SECRETS__MEMORY_DB_PATH": sqlite_path.as_posix(),
-        },
-    )
-    catalog = discover_products(settings, repo_root=repo_root)
-    register_enabled_products(catalog, settings=settings)
-    engine = OrchestratorEngine.from_settings(settings)
+def test_smoke_engine_init(
+    registered_products: Tuple[Settings, ProductCatalog],
+    sqlite_memory: MemoryRouter,
+) -> None:
+    settings, catalog = registered_products
+    assert "hello_world" in catalog.products
+    engine = OrchestratorEngine.from_settings(settings, memory=sqlite_memory)
     assert engine is not None
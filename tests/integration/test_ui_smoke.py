@@ -4,21 +4,36 @@ from typing import Any
 # UI Smoke Test
 # ==============================
 import json
+from collections import deque
 from types import SimpleNamespace
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"))
+
 
 class _FakeResponse:
     def __init__(self, body: dict, ok: bool = True) -> None:
         self._body = body
         self.ok = ok
+        self.content = _dumps(body).encode("utf-8")
 
     def json(self) -> dict:
         return self._body
 
 
 class _FakeStreamlit:
+    __slots__ = ("calls", "session_state")
+
     def __init__(self) -> None:
-        self.calls: list[tuple[str, str]] = []
+        self.calls: deque[tuple[str, str]] = deque()
         self.session_state: dict[str, Any] = {}
 
     def subheader(self, value: str) -> None:
@@ -28,7 +43,7 @@ class _FakeStreamlit:
         self.calls.append(("info", message))
 
     def write(self, value: Any) -> None:
-        self.calls.append(("write", str(value)))
+        self.calls.append(("write", value if isinstance(value, str) else str(value)))
 
     def markdown(self, value: str) -> None:
         self.calls.append(("markdown", value))
@@ -44,7 +59,7 @@ class _FakeStreamlit:
         self.calls.append(("expander_close", ""))
 
     def table(self, value: Any) -> None:
-        self.calls.append(("table", json.dumps(value)))
+        self.calls.append(("table", _dumps(value)))
 
     def columns(self, count: int):
         return (self, self)
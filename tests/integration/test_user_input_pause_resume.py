@@ -4,7 +4,11 @@ from __future__ import annotations
 # Integration: User Input Pause/Resume
 # ==============================
 
+import functools
 from pathlib import Path
+from typing import Callable, Tuple
+
+import pytest
 
 from core.agents.registry import AgentRegistry
 from core.contracts.run_schema import RunStatus, StepStatus
@@ -31,54 +35,44 @@ class _EchoTool(BaseTool):
         return ToolResult(ok=True, data={"summary": "ok", "details": params}, error=None, meta=meta)
 
 
-def _write_flow(tmp_path: Path) -> Path:
-    flows_dir = tmp_path / "products" / "test_product" / "flows"
-    flows_dir.mkdir(parents=True, exist_ok=True)
-    flow_path = flows_dir / "test_flow.yaml"
-    flow_path.write_text(
-        "\n".join(
-            [
-                'id: "test_flow"',
-                'version: "1.0.0"',
-                "steps:",
-                '  - id: "input"',
-                '    type: "user_input"',
-                "    params:",
-                '      schema_version: "1.0"',
-                '      form_id: "notes"',
-                '      prompt: "Notes"',
-                '      input_type: "select"',
-                '      mode: "choice_input"',
-                "      schema:",
-                '        type: "object"',
-                "        properties:",
-                "          selection:",
-                '            type: "string"',
-                "            enum:",
-                '              - "alpha"',
-                '              - "beta"',
-                "      required:",
-                '        - "selection"',
-                '  - id: "echo"',
-                '    type: "tool"',
-                '    backend: "local"',
-                '    tool: "echo_tool"',
-                "    params:",
-                '      text: "{{artifacts.user_input.notes.values.selection}}"',
-                "",
-            ]
-        ),
-        encoding="utf-8",
-    )
-    return flow_path
+_FLOW = {
+    "id": "test_flow",
+    "version": "1.0.0",
+    "steps": [
+        {
+            "id": "input",
+            "type": "user_input",
+            "params": {
+                "schema_version": "1.0",
+                "form_id": "notes",
+                "prompt": "Notes",
+                "input_type": "select",
+                "mode": "choice_input",
+                "schema": {"type": "object", "properties": {"selection": {"type": "string", "enum": ["alpha", "beta"]}}},
+                "required": ["selection"],
+            },
+        },
+        {
+            "id": "echo",
+            "type": "tool",
+            "backend": "local",
+            "tool": "echo_tool",
+            "params": {"text": "{{artifacts.user_input.notes.values.selection}}"},
+        },
+    ],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_settings() -> Settings:
+    return Settings()
 
 
 def _build_engine(tmp_path: Path) -> OrchestratorEngine:
-    flow_path = _write_flow(tmp_path)
-    flow_loader = FlowLoader(products_root=flow_path.parents[2])
+    flow_loader = FlowLoader.from_mapping({"test_product": {"test_flow": _FLOW}}, products_root=tmp_path / "products")
     memory = MemoryRouter(backend=InMemoryBackend(), repo_root=tmp_path, observability_root=tmp_path / "observability")
     tracer = Tracer(memory=memory, mirror_to_log=False)
-    governance = GovernanceHooks(settings=Settings())
+    governance = GovernanceHooks(settings=_default_settings())
     tool_executor = ToolExecutor(registry=ToolRegistry, hooks=governance, redactor=SecurityRedactor())
     step_executor = StepExecutor(tool_executor=tool_executor, governance=governance, agent_registry=AgentRegistry)
     return OrchestratorEngine(
@@ -90,12 +84,24 @@ def _build_engine(tmp_path: Path) -> OrchestratorEngine:
     )
 
 
-def test_user_input_pause_and_resume(tmp_path: Path) -> None:
+@pytest.fixture(scope="module")
+def user_input_engine(tmp_path_factory: pytest.TempPathFactory) -> Tuple[OrchestratorEngine, Callable[[], None]]:
+    """Engine shared by the default-settings tests; reset() empties run storage in place and re-registers echo_tool."""
+    engine = _build_engine(tmp_path_factory.mktemp("user_input"))
+
+    def reset() -> None:
+        engine.memory.reset()
+        ToolRegistry.register("echo_tool", _EchoTool, overwrite=True)
+
+    return engine, reset
+
+
+def test_user_input_pause_and_resume(user_input_engine: Tuple[OrchestratorEngine, Callable[[], None]]) -> None:
+    engine, reset = user_input_engine
     AgentRegistry.clear()
     ToolRegistry.clear()
     try:
-        ToolRegistry.register("echo_tool", lambda: _EchoTool())
-        engine = _build_engine(tmp_path)
+        reset()
 
         started = engine.run_flow(product="test_product", flow="test_flow", payload={})
         assert started.ok, started.error
@@ -105,8 +111,8 @@ def test_user_input_pause_and_resume(tmp_path: Path) -> None:
         bundle = engine.memory.get_run(run_id)
         assert bundle is not None
         assert bundle.run.status == RunStatus.PAUSED_WAITING_FOR_USER
-        step = next(s for s in bundle.steps if s.step_id == "input")
-        assert step.status == StepStatus.PENDING_USER_INPUT
+        steps_by_id = {s.step_id: s for s in bundle.steps}
+        assert steps_by_id["input"].status == StepStatus.PENDING_USER_INPUT
 
         resumed = engine.resume_run(
             run_id=run_id,
@@ -118,19 +124,19 @@ def test_user_input_pause_and_resume(tmp_path: Path) -> None:
         bundle = engine.memory.get_run(run_id)
         assert bundle is not None
         assert bundle.run.status == RunStatus.COMPLETED
-        step = next(s for s in bundle.steps if s.step_id == "input")
-        assert step.status == StepStatus.COMPLETED
+        steps_by_id = {s.step_id: s for s in bundle.steps}
+        assert steps_by_id["input"].status == StepStatus.COMPLETED
     finally:
         AgentRegistry.clear()
         ToolRegistry.clear()
 
 
-def test_user_input_invalid_response_rejected(tmp_path: Path) -> None:
+def test_user_input_invalid_response_rejected(user_input_engine: Tuple[OrchestratorEngine, Callable[[], None]]) -> None:
+    engine, reset = user_input_engine
     AgentRegistry.clear()
     ToolRegistry.clear()
     try:
-        ToolRegistry.register("echo_tool", lambda: _EchoTool())
-        engine = _build_engine(tmp_path)
+        reset()
 
         started = engine.run_flow(product="test_product", flow="test_flow", payload={})
         assert started.ok, started.error
@@ -1,37 +1,69 @@
 
 from __future__ import annotations
 
-import importlib
-import sys
+import ast
+from collections import deque
 from pathlib import Path
+from typing import Iterator, Optional, Set, Tuple
 
+from tests._scan_utils import iter_imports
 
-def _import(module_name: str) -> None:
-    importlib.import_module(module_name)
+REPO_ROOT = Path(__file__).resolve().parents[2]
+FIRST_PARTY = ("core", "gateway", "products")
+RUNTIME_ENTRYPOINTS = ("gateway.api.http_app", "gateway.ui.platform_app")
 
 
-def _knowledge_modules(loaded: set[str]) -> set[str]:
-    return {
-        name
-        for name in loaded
-        if name == "core.knowledge" or name.startswith("core.knowledge.")
-    }
+def _module_path(name: str) -> Optional[Path]:
+    # Resolved against the repo tree instead of importlib.util.find_spec, which would
+    # import (and so execute) every parent package of `name`.
+    if name.split(".", 1)[0] not in FIRST_PARTY:
+        return None
+    base = REPO_ROOT.joinpath(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
 
 
-def test_v1_runtime_imports_do_not_require_knowledge(tmp_path, monkeypatch) -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    storage_dir = tmp_path / "storage"
+def _imported_names(name: str, path: Path) -> Iterator[str]:
+    package = name if path.name == "__init__.py" else name.rpartition(".")[0]
+    for node in iter_imports(path):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+            continue
+        base = node.module or ""
+        if node.level:
+            anchor = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+            base = f"{anchor}.{base}" if base else anchor
+        yield base
+        # `from pkg import mod` may name a submodule rather than an attribute.
+        yield from (f"{base}.{alias.name}" for alias in node.names if alias.name != "*")
 
-    monkeypatch.setenv("MASTER__APP__PATHS__REPO_ROOT", repo_root.as_posix())
-    monkeypatch.setenv("MASTER__APP__PATHS__STORAGE_DIR", storage_dir.as_posix())
 
-    before_modules = set(sys.modules)
+def _closure(roots: Tuple[str, ...]) -> Set[str]:
+    """First-party modules reachable from `roots` through static imports, parent packages included."""
+    seen: Set[str] = set()
+    pending = deque(roots)
+    while pending:
+        name = pending.popleft()
+        if name in seen:
+            continue
+        path = _module_path(name)
+        if path is None:
+            continue
+        seen.add(name)
+        parent = name.rpartition(".")[0]
+        if parent:
+            pending.append(parent)
+        pending.extend(_imported_names(name, path))
+    return seen
 
-    _import("gateway.api.http_app")
-    _import("gateway.ui.platform_app")
 
-    new_modules = set(sys.modules) - before_modules
-    knowledge_loaded = _knowledge_modules(new_modules)
+def test_v1_runtime_imports_do_not_require_knowledge() -> None:
+    closure = _closure(RUNTIME_ENTRYPOINTS)
+    assert set(RUNTIME_ENTRYPOINTS) <= closure
 
-    assert not knowledge_loaded, f"Unexpected knowledge modules loaded: {sorted(knowledge_loaded)}"
-    assert not (storage_dir / "vectors").exists(), "Vector store initialized during import"
+    knowledge = sorted(name for name in closure if name == "core.knowledge" or name.startswith("core.knowledge."))
+    assert not knowledge, f"Unexpected knowledge module import: {knowledge}"
+    # The vector store is the only code that creates storage/vectors.
+    assert "core.knowledge.vector_store" not in closure
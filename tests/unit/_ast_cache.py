@@ -0,0 +1,58 @@
+# ==============================
+# Shared AST Cache for Import Guardrails
+# ==============================
+"""
+Import lookups for the import guardrail tests, cached per (path, st_mtime_ns).
+
+The import guardrail tests walk overlapping file sets (test_v1_invariants
+re-runs four of them). Reading and parsing go through tests/_scan_utils.py, so
+an edited file is parsed again rather than served stale. Files whose bytes
+never mention a forbidden prefix are not parsed at all.
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import os
+import re
+from typing import List, Tuple
+
+from tests._scan_utils import PathLike, iter_statements, parse_tree, source_bytes
+
+
+def forbidden_imports(path: PathLike, prefixes: Tuple[str, ...]) -> List[str]:
+    """Return a preformatted "path: module" line per import in `path` starting with one of `prefixes`."""
+    path_str = os.fspath(path)
+    return [f"{path_str}: {module}" for module in _forbidden(path_str, os.stat(path_str).st_mtime_ns, prefixes)]
+
+
+def forbidden_modules(path: PathLike, prefixes: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Module names imported by `path` that start with one of `prefixes`."""
+    path_str = os.fspath(path)
+    return _forbidden(path_str, os.stat(path_str).st_mtime_ns, prefixes)
+
+
+@functools.lru_cache(maxsize=None)
+def _prefix_pattern(prefixes: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    # Unanchored on purpose: `import os, openai` or a backslash-continued import must still hit.
+    return re.compile(b"|".join(re.escape(prefix.encode("utf-8")) for prefix in prefixes))
+
+
+@functools.lru_cache(maxsize=None)
+def _imported_modules(path_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    names: List[str] = []
+    for node in iter_statements(parse_tree(path_str, mtime_ns).body):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.append(node.module)
+    return tuple(names)
+
+
+@functools.lru_cache(maxsize=None)
+def _forbidden(path_str: str, mtime_ns: int, prefixes: Tuple[str, ...]) -> Tuple[str, ...]:
+    # An import of `prefix...` cannot exist unless the prefix text does; skip the parse otherwise.
+    if _prefix_pattern(prefixes).search(source_bytes(path_str, mtime_ns)) is None:
+        return ()
+    return tuple(name for name in _imported_modules(path_str, mtime_ns) if name.startswith(prefixes))
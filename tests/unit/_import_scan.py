@@ -0,0 +1,43 @@
+# ==============================
+# Generic Import Guardrail Scanner
+# ==============================
+"""
+One scanner shared by the import guardrail tests.
+
+Each guardrail module declares its ROOTS, FORBIDDEN_PREFIXES and optional
+REQUIRE_DIRS and calls scan(). test_v1_invariants reuses the same declarations
+through files(). Parsing goes through _ast_cache, so a file is parsed once no
+matter how many guardrails look at it.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import AbstractSet, Iterable, List, Tuple
+
+from tests._scan_utils import walk_py
+from tests.unit._ast_cache import forbidden_imports
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def files(roots: Iterable[Path], require_any: AbstractSet[str] = frozenset()) -> List[str]:
+    """.py files under the existing `roots`, limited to files below a `require_any` directory if given."""
+    out: List[str] = []
+    for root in roots:
+        if not root.exists():
+            continue
+        out.extend(walk_py(root, require_any=require_any))
+    return out
+
+
+def scan(
+    roots: Iterable[Path],
+    forbidden_prefixes: Tuple[str, ...],
+    require_any: AbstractSet[str] = frozenset(),
+) -> List[str]:
+    """Return a "path: module" line for every forbidden import under `roots`."""
+    offenders: List[str] = []
+    for path in files(roots, require_any):
+        offenders.extend(forbidden_imports(path, forbidden_prefixes))
+    return offenders
@@ -6,6 +6,11 @@ from __future__ import annotations
 
 import json
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
 from core.agents.llm_reasoner import (
     ExplanationReasoner,
     InsightReasoner,
@@ -23,9 +28,15 @@ def _make_step_ctx(agent_name: str, params: dict) -> "object":
     return run_ctx.new_step(step_def=step_def)
 
 
+def _dumps(payload: dict) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
 def _fake_llm_result(payload: dict) -> AgentResult:
     meta = AgentMeta(agent_name="llm_reasoner", kind=AgentKind.OTHER, tags={})
-    return AgentResult(ok=True, data={"content": json.dumps(payload)}, error=None, meta=meta)
+    return AgentResult(ok=True, data={"content": _dumps(payload)}, error=None, meta=meta)
 
 
 def test_registry_registers_core_role_agents() -> None:
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+# ==============================
+# Tests: FlowLoader YAML loader selection
+# ==============================
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from core.orchestrator.flow_loader import FlowLoader
+
+_FLOW_YAML_BYTES = "\n".join(
+    [
+        'id: "demo"',
+        'version: "1.0.0"',
+        "steps:",
+        '  - id: "echo"',
+        '    type: "tool"',
+        '    tool: "echo_tool"',
+        "",
+    ]
+).encode("utf-8")
+
+
+def test_flow_loader_prefers_libyaml_loader() -> None:
+    if not getattr(yaml, "__with_libyaml__", False):
+        pytest.skip("libyaml bindings not available")
+    assert FlowLoader._LOADER is yaml.CSafeLoader
+
+
+def test_flow_loader_reads_yaml_with_selected_loader(tmp_path: Path) -> None:
+    flow_path = tmp_path / "demo.yaml"
+    flow_path.write_bytes(_FLOW_YAML_BYTES)
+    flow = FlowLoader.load_from_path(flow_path)
+    assert flow.id == "demo"
+    assert [step.id for step in flow.steps] == ["echo"]
+
+
+def test_flow_loader_from_mapping_serves_flows_without_files(tmp_path: Path) -> None:
+    mapping = {"demo_product": {"demo": {"id": "demo", "steps": [{"id": "echo", "type": "tool", "tool": "echo_tool"}]}}}
+    loader = FlowLoader.from_mapping(mapping, products_root=tmp_path)
+    first = loader.load(product="demo_product", flow="demo")
+    second = loader.load(product="demo_product", flow="demo")
+    assert first.id == "demo"
+    assert first is not second
+
+
+def test_flow_loader_reparses_edited_yaml(tmp_path: Path) -> None:
+    flow_path = tmp_path / "demo.yaml"
+    flow_path.write_bytes(_FLOW_YAML_BYTES)
+    assert FlowLoader.load_from_path(flow_path).steps[0].id == "echo"
+    flow_path.write_bytes(_FLOW_YAML_BYTES.replace(b'"echo"', b'"echo_again"', 1))
+    assert FlowLoader.load_from_path(flow_path).steps[0].id == "echo_again"
+
+
+def test_flow_loader_serves_flowcache_built_from_current_yaml(tmp_path: Path) -> None:
+    flow_path = tmp_path / "demo.yaml"
+    flow_path.write_bytes(_FLOW_YAML_BYTES)
+    cache = FlowLoader.write_cache(flow_path)
+    assert cache.name == "demo.flowcache.json"
+    # Rewrite only the cached flow: seeing it proves the YAML was not re-parsed.
+    data = json.loads(cache.read_bytes())
+    data["flow"]["steps"][0]["id"] = "from_cache"
+    cache.write_text(json.dumps(data), encoding="utf-8")
+    assert FlowLoader.load_from_path(flow_path).steps[0].id == "from_cache"
+
+
+def test_flow_loader_ignores_flowcache_after_same_mtime_edit(tmp_path: Path) -> None:
+    flow_path = tmp_path / "demo.yaml"
+    flow_path.write_bytes(_FLOW_YAML_BYTES)
+    cache = FlowLoader.write_cache(flow_path)
+    stat = cache.stat()
+    flow_path.write_bytes(_FLOW_YAML_BYTES.replace(b'"echo"', b'"echo_again"', 1))
+    # Same tick as the cache, as on coarse-mtime filesystems or after a checkout.
+    os.utime(flow_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert FlowLoader.load_from_path(flow_path).steps[0].id == "echo_again"
@@ -14,6 +14,19 @@ def test_sqlite_backend_concurrent_writes(tmp_path) -> None:
     thread_count = 6
     runs_per_thread = 10
     total_runs = thread_count * runs_per_thread
+    # Built before the barrier so the threads race on sqlite writes, not on pydantic validation.
+    records = [
+        [
+            RunRecord(
+                run_id=f"run-{thread_id}-{idx}",
+                product="demo",
+                flow="flow",
+                autonomy_level="semi_auto",
+            )
+            for idx in range(runs_per_thread)
+        ]
+        for thread_id in range(thread_count)
+    ]
     barrier = threading.Barrier(thread_count)
     errors = []
     lock = threading.Lock()
@@ -21,14 +34,7 @@ def test_sqlite_backend_concurrent_writes(tmp_path) -> None:
     def worker(thread_id: int) -> None:
         try:
             barrier.wait()
-            for idx in range(runs_per_thread):
-                run = RunRecord(
-                    run_id=f"run-{thread_id}-{idx}",
-                    product="demo",
-                    flow="flow",
-                    autonomy_level="semi_auto",
-                )
-                backend.create_run(run)
+            backend.create_runs(records[thread_id])
         except Exception as exc:  # pragma: no cover - failure path
             with lock:
                 errors.append(exc)
@@ -5,125 +5,357 @@ from __future__ import annotations
 # ==============================
 
 import ast
+import functools
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections import defaultdict
 from pathlib import Path
-from typing import Iterable, List, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
+import pytest
 
-_EXCLUDED_DIRS = {".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests"}
+from tests._scan_utils import get_source, get_tree, walk_py
+
+
+_EXCLUDED_DIRS = frozenset({".git", ".venv", "venv", "__pycache__", "storage", "secrets", "tests"})
+# SCAN_FAIL_FAST=1 stops each scan at its first offending file (quick local pass/fail);
+# the default collects every offender so CI prints the full list.
+_FAIL_FAST = os.environ.get("SCAN_FAIL_FAST", "") == "1"
 
 
 def _iter_python_files(root: Path) -> Iterable[Path]:
-    for path in root.rglob("*.py"):
-        if not path.is_file():
-            continue
-        if any(part in _EXCLUDED_DIRS for part in path.parts):
-            continue
-        yield path
+    # Excluded directories are pruned at descent, so .git/.venv/storage are never walked.
+    for path in walk_py(root, _EXCLUDED_DIRS):
+        yield Path(path)
 
 
-def _scan_agent_to_agent_calls(root: Path) -> List[str]:
-    offenders: List[str] = []
-    for path in _iter_python_files(root):
-        if "agents" not in path.parts:
-            continue
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(path))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom) and node.module == "core.agents.registry":
-                offenders.append(f"{path}: imports AgentRegistry")
-            if isinstance(node, ast.Call):
-                func = node.func
-                if isinstance(func, ast.Attribute) and func.attr == "resolve":
-                    if isinstance(func.value, ast.Name) and func.value.id == "AgentRegistry":
-                        offenders.append(f"{path}: AgentRegistry.resolve()")
-    return offenders
-
-
-def _scan_dynamic_flow_mutation(root: Path) -> List[str]:
-    offenders: List[str] = []
-    for path in _iter_python_files(root):
-        if "orchestrator" not in path.parts and "products" not in path.parts:
-            continue
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(path))
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.Assign, ast.AugAssign)) and isinstance(node.target if isinstance(node, ast.AugAssign) else node.targets[0], ast.Attribute):
-                target = node.target if isinstance(node, ast.AugAssign) else node.targets[0]
-                if isinstance(target, ast.Attribute) and target.attr == "steps":
-                    offenders.append(f"{path}: assigns to steps")
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
-                if isinstance(node.func.value, ast.Attribute) and node.func.value.attr == "steps":
-                    if node.func.attr in {"append", "extend", "insert", "pop", "remove", "clear"}:
-                        offenders.append(f"{path}: mutates steps via {node.func.attr}")
-    return offenders
-
-
-def _scan_autonomous_retries(root: Path) -> List[str]:
-    offenders: List[str] = []
-    for path in _iter_python_files(root):
-        if not any(part in path.parts for part in ("agents", "tools", "products")):
-            continue
-        if path.name in {"step_executor.py", "error_policy.py"}:
-            continue
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(path))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    if alias.name.startswith("tenacity"):
-                        offenders.append(f"{path}: imports tenacity")
-            if isinstance(node, ast.ImportFrom):
-                if (node.module or "").startswith("tenacity"):
-                    offenders.append(f"{path}: imports tenacity")
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
-                if isinstance(node.func.value, ast.Name) and node.func.value.id in {"time", "asyncio"}:
-                    if node.func.attr == "sleep":
-                        offenders.append(f"{path}: sleep() usage")
-    return offenders
-
-
-def _scan_hidden_product_state(root: Path) -> List[str]:
-    offenders: List[str] = []
-    for path in _iter_python_files(root):
-        if "products" not in path.parts:
-            continue
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(path))
-        for node in tree.body:
-            if isinstance(node, ast.Assign):
-                for target in node.targets:
-                    if not isinstance(target, ast.Name):
-                        continue
-                    name = target.id
-                    if name.isupper():
-                        continue
-                    if isinstance(node.value, (ast.Dict, ast.List, ast.Set)):
+AGENT_TO_AGENT_CALLS = "agent_to_agent_calls"
+DYNAMIC_FLOW_MUTATION = "dynamic_flow_mutation"
+AUTONOMOUS_RETRIES = "autonomous_retries"
+HIDDEN_PRODUCT_STATE = "hidden_product_state"
+SELF_MODIFYING_FLOWS = "self_modifying_flows"
+_SCANS = (
+    AGENT_TO_AGENT_CALLS,
+    DYNAMIC_FLOW_MUTATION,
+    AUTONOMOUS_RETRIES,
+    HIDDEN_PRODUCT_STATE,
+    SELF_MODIFYING_FLOWS,
+)
+
+_RETRY_DIRS = frozenset({"agents", "tools", "products"})
+_RETRY_POLICY_FILES = frozenset({"step_executor.py", "error_policy.py"})
+_STEP_MUTATORS = frozenset({"append", "extend", "insert", "pop", "remove", "clear"})
+
+# Byte sieves: every check keys on an identifier (a name, attribute or module part), and
+# identifiers appear verbatim in source. A file without any of a check's tokens cannot trip it.
+_AGENT_TOKENS = (b"AgentRegistry", b"registry")
+_MUTATION_TOKENS = (b"steps",)
+# `sleep` only as a whole word, so `sleepy`/`asleep` helpers no longer force a parse;
+# `tenacity` stays a bare prefix to match the startswith check on module names.
+_RETRY_PATTERN = re.compile(rb"tenacity|\bsleep\b")
+_FLOW_FILE_TOKENS = (b"open", b"write_text", b"write_bytes")
+
+
+def _mentions(source: bytes, tokens: Tuple[bytes, ...]) -> bool:
+    return any(token in source for token in tokens)
+
+
+# Never the node a check matches and never a container of one, so never pushed.
+# Names and constants a check does inspect are reached through their parent Call.
+_LEAF_TYPES = (ast.Constant, ast.Name, ast.alias, ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop)
+
+
+def _iter_nodes(tree: ast.AST) -> Iterator[ast.AST]:
+    """Explicit-stack ast.walk that skips leaf subtrees (no deque, no iter_child_nodes generator)."""
+    stack: List[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        yield node
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                stack.extend(
+                    child for child in value if isinstance(child, ast.AST) and not isinstance(child, _LEAF_TYPES)
+                )
+            elif isinstance(value, ast.AST) and not isinstance(value, _LEAF_TYPES):
+                stack.append(value)
+
+
+def _index(tree: ast.AST) -> Dict[type, List[Any]]:
+    """Bucket every walked node by its exact type, so each check iterates only its node kind."""
+    buckets: Dict[type, List[Any]] = defaultdict(list)
+    for node in _iter_nodes(tree):
+        buckets[type(node)].append(node)
+    return buckets
+
+
+# Parsed trees contain exact ast classes (no subclasses), so the checks compare
+# `type(node) is ...` against these module-level aliases instead of isinstance chains.
+_Assign = ast.Assign
+_AugAssign = ast.AugAssign
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Import = ast.Import
+_ImportFrom = ast.ImportFrom
+_Name = ast.Name
+
+
+def _flow_file_arg(node: ast.Call) -> Optional[str]:
+    if not node.args:
+        return None
+    arg = node.args[0]
+    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+        if "/flows/" in arg.value and arg.value.endswith((".yaml", ".yml")):
+            return arg.value
+    return None
+
+
+def _scan_hidden_product_state(path: Path, tree: ast.Module, offenders: List[str]) -> None:
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                name = target.id
+                if name.isupper():
+                    continue
+                if isinstance(node.value, (ast.Dict, ast.List, ast.Set)):
+                    offenders.append(f"{path}: mutable module state '{name}'")
+                if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name):
+                    if node.value.func.id in {"dict", "list", "set"}:
                         offenders.append(f"{path}: mutable module state '{name}'")
-                    if isinstance(node.value, ast.Call) and isinstance(node.value.func, ast.Name):
-                        if node.value.func.id in {"dict", "list", "set"}:
-                            offenders.append(f"{path}: mutable module state '{name}'")
-    return offenders
-
-
-def _scan_self_modifying_flows(root: Path) -> List[str]:
-    offenders: List[str] = []
-    for path in _iter_python_files(root):
-        source = path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(path))
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
-                if node.func.attr in {"write_text", "write_bytes"} and node.args:
-                    arg = node.args[0]
-                    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                        if "/flows/" in arg.value and arg.value.endswith((".yaml", ".yml")):
-                            offenders.append(f"{path}: writes flow file {arg.value}")
-            if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "open":
-                if node.args:
-                    arg = node.args[0]
-                    if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                        if "/flows/" in arg.value and arg.value.endswith((".yaml", ".yml")):
-                            offenders.append(f"{path}: opens flow file {arg.value}")
-    return offenders
+
+
+class _GuardrailVisitor(ast.NodeVisitor):
+    """
+    Node-level checks for one file, one visit_<Type> method per node kind.
+
+    scan() walks the tree once into type buckets and hands each bucket to its method,
+    so the method lookup happens per type rather than per node. The visit_ methods do
+    not recurse. Each check runs only when its flag is set (path scope and byte sieve
+    passed); offenders go straight into the caller's result buckets.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        results: Dict[str, List[str]],
+        *,
+        agents: bool,
+        mutation: bool,
+        retries: bool,
+        flow_files: bool,
+    ) -> None:
+        self.path = path
+        self.agents = agents
+        self.mutation = mutation
+        self.retries = retries
+        self.flow_files = flow_files
+        self.agent_calls = results[AGENT_TO_AGENT_CALLS]
+        self.flow_mutation = results[DYNAMIC_FLOW_MUTATION]
+        self.retry_uses = results[AUTONOMOUS_RETRIES]
+        self.self_modifying = results[SELF_MODIFYING_FLOWS]
+
+    def scan(self, tree: ast.AST) -> None:
+        for node_type, nodes in _index(tree).items():
+            method = getattr(self, f"visit_{node_type.__name__}", None)
+            if method is None:
+                continue
+            for node in nodes:
+                method(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        # Traversal is _index()'s job; visit() on an unchecked node type does nothing.
+        return None
+
+    def visit_Call(self, node: ast.Call) -> None:
+        path = self.path
+        func = node.func
+        func_type = type(func)
+        if func_type is _Attribute:
+            owner = func.value
+            owner_type = type(owner)
+            attr = func.attr
+            if self.agents and attr == "resolve":
+                if owner_type is _Name and owner.id == "AgentRegistry":
+                    self.agent_calls.append(f"{path}: AgentRegistry.resolve()")
+            if self.mutation and owner_type is _Attribute and owner.attr == "steps":
+                if attr in _STEP_MUTATORS:
+                    self.flow_mutation.append(f"{path}: mutates steps via {attr}")
+            if self.retries and attr == "sleep":
+                if owner_type is _Name and owner.id in {"time", "asyncio"}:
+                    self.retry_uses.append(f"{path}: sleep() usage")
+            if self.flow_files and attr in {"write_text", "write_bytes"}:
+                flow_file = _flow_file_arg(node)
+                if flow_file is not None:
+                    self.self_modifying.append(f"{path}: writes flow file {flow_file}")
+        elif self.flow_files and func_type is _Name and func.id == "open":
+            flow_file = _flow_file_arg(node)
+            if flow_file is not None:
+                self.self_modifying.append(f"{path}: opens flow file {flow_file}")
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if self.agents and node.module == "core.agents.registry":
+            self.agent_calls.append(f"{self.path}: imports AgentRegistry")
+        if self.retries and (node.module or "").startswith("tenacity"):
+            self.retry_uses.append(f"{self.path}: imports tenacity")
+
+    def visit_Import(self, node: ast.Import) -> None:
+        if self.retries:
+            for alias in node.names:
+                if alias.name.startswith("tenacity"):
+                    self.retry_uses.append(f"{self.path}: imports tenacity")
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self._check_steps_target(node.targets[0])
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        self._check_steps_target(node.target)
+
+    def _check_steps_target(self, target: ast.expr) -> None:
+        if self.mutation and type(target) is _Attribute and target.attr == "steps":
+            self.flow_mutation.append(f"{self.path}: assigns to steps")
+
+
+def _scan_file(path_str: str, skip: FrozenSet[str] = frozenset()) -> Dict[str, List[str]]:
+    """
+    Run all five scans over one file: it is parsed (at most once per process) and walked once into type buckets.
+
+    A scan only applies to files under the directories it guards, decided from the path parts;
+    scans named in `skip` are not run.
+    """
+    path = Path(path_str)
+    results: Dict[str, List[str]] = {name: [] for name in _SCANS}
+    parts: Set[str] = set(path.parts)
+    source: bytes = get_source(path)
+    check_agents = AGENT_TO_AGENT_CALLS not in skip and "agents" in parts and _mentions(source, _AGENT_TOKENS)
+    check_mutation = (
+        DYNAMIC_FLOW_MUTATION not in skip
+        and ("orchestrator" in parts or "products" in parts)
+        and _mentions(source, _MUTATION_TOKENS)
+    )
+    check_retries = (
+        AUTONOMOUS_RETRIES not in skip
+        and not parts.isdisjoint(_RETRY_DIRS)
+        and path.name not in _RETRY_POLICY_FILES
+        and _RETRY_PATTERN.search(source) is not None
+    )
+    check_flow_files = SELF_MODIFYING_FLOWS not in skip and _mentions(source, _FLOW_FILE_TOKENS)
+    # Any module-level assignment can be hidden state, so product files are never sieved.
+    check_hidden = HIDDEN_PRODUCT_STATE not in skip and "products" in parts
+    if not (check_agents or check_mutation or check_retries or check_flow_files or check_hidden):
+        return results
+
+    # Shared, (path, mtime)-keyed parse: files the import guardrails already parsed are free.
+    tree: ast.Module = get_tree(path)
+    if check_hidden:
+        _scan_hidden_product_state(path, tree, results[HIDDEN_PRODUCT_STATE])
+
+    _GuardrailVisitor(
+        path,
+        results,
+        agents=check_agents,
+        mutation=check_mutation,
+        retries=check_retries,
+        flow_files=check_flow_files,
+    ).scan(tree)
+    return results
+
+
+# Per-file results are kept in pytest's cache dir (.pytest_cache, emptied by --cache-clear)
+# as one index per scanner version: the version hashes this module and the
+# tests/_scan_utils.py helpers it parses with, so editing a check starts a fresh index
+# and older ones are deleted. Each index holds only the files seen by the latest scan,
+# keyed on their stat.
+# Offender buckets are cached rather than pickled ASTs: unpickling a tree is slower than
+# parsing it again.
+_SCANNER_VERSION = hashlib.sha1(
+    Path(__file__).read_bytes() + (Path(__file__).parents[1] / "_scan_utils.py").read_bytes()
+).hexdigest()[:16]
+_RESULT_CACHE_NAME = "master_guardrail_scan"
+
+# [st_mtime_ns, st_size, offenders by scan name]; a list so it round-trips through JSON unchanged.
+_CacheEntry = List[Any]
+
+
+def _load_result_index(cache_dir: Path) -> Dict[str, _CacheEntry]:
+    try:
+        data = json.loads((cache_dir / f"{_SCANNER_VERSION}.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _store_result_index(cache_dir: Path, index: Dict[str, _CacheEntry]) -> None:
+    try:
+        for stale in cache_dir.glob("*.json"):
+            if stale.stem != _SCANNER_VERSION:
+                stale.unlink()
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(json.dumps(index).encode("utf-8"))
+        os.replace(tmp_name, cache_dir / f"{_SCANNER_VERSION}.json")
+    except OSError:
+        # Read-only or full cache dir: the scan results are still correct, just not cached.
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _scan_all(root_str: str, cache_dir: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Scan every file under `root_str` in-process; offenders keyed by scan name.
+
+    In-process on purpose, like _scan_sections in test_v1_invariants: parses land in the
+    shared tests/_scan_utils.py cache that the import guardrails fill, and the byte sieves leave few files
+    to parse at all. With `cache_dir`, files whose stat matches the cached index reuse
+    their previous results.
+    """
+    paths: List[str] = [str(path) for path in _iter_python_files(Path(root_str))]
+    if _FAIL_FAST:
+        return _scan_until_each_fails(paths)
+    cached = _load_result_index(Path(cache_dir)) if cache_dir else {}
+    index: Dict[str, _CacheEntry] = {}
+    results: Dict[str, List[str]] = {name: [] for name in _SCANS}
+    for path in paths:
+        try:
+            info = os.stat(path)
+        except OSError:
+            # Removed between the walk and the scan: nothing left to check.
+            continue
+        entry = cached.get(path)
+        if entry is not None and entry[0] == info.st_mtime_ns and entry[1] == info.st_size:
+            found = entry[2]
+        else:
+            found = _scan_file(path)
+        index[path] = [info.st_mtime_ns, info.st_size, found]
+        for name, offenders in found.items():
+            results[name].extend(offenders)
+    if cache_dir and index != cached:
+        _store_result_index(Path(cache_dir), index)
+    return results
+
+
+@pytest.fixture(scope="module")
+def scan_results(request: pytest.FixtureRequest) -> Dict[str, List[str]]:
+    """All five scans over the repo; cached across runs only when pytest's cacheprovider is on."""
+    cache = getattr(request.config, "cache", None)
+    cache_dir = str(cache.mkdir(_RESULT_CACHE_NAME)) if cache is not None else None
+    return _scan_all(str(Path(__file__).resolve().parents[2]), cache_dir)
+
+
+def _scan_until_each_fails(paths: List[str]) -> Dict[str, List[str]]:
+    """Serial scan that drops each check after its first offending file and stops once all have failed."""
+    results: Dict[str, List[str]] = {name: [] for name in _SCANS}
+    for path in paths:
+        failed = frozenset(name for name, offenders in results.items() if offenders)
+        if len(failed) == len(_SCANS):
+            break
+        for name, offenders in _scan_file(path, skip=failed).items():
+            results[name].extend(offenders)
+    return results
 
 
 def _fail_if(offenders: List[str], *, title: str) -> None:
@@ -132,31 +364,26 @@ def _fail_if(offenders: List[str], *, title: str) -> None:
         raise AssertionError(f"{title}:\n{details}")
 
 
-def test_no_agent_to_agent_calls() -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    offenders = _scan_agent_to_agent_calls(repo_root)
+def test_no_agent_to_agent_calls(scan_results: Dict[str, List[str]]) -> None:
+    offenders = scan_results[AGENT_TO_AGENT_CALLS]
     _fail_if(offenders, title="Agent-to-agent calls are forbidden")
 
 
-def test_no_dynamic_flow_mutation() -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    offenders = _scan_dynamic_flow_mutation(repo_root)
+def test_no_dynamic_flow_mutation(scan_results: Dict[str, List[str]]) -> None:
+    offenders = scan_results[DYNAMIC_FLOW_MUTATION]
     _fail_if(offenders, title="Dynamic flow mutation is forbidden")
 
 
-def test_no_autonomous_retries_without_policy() -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    offenders = _scan_autonomous_retries(repo_root)
+def test_no_autonomous_retries_without_policy(scan_results: Dict[str, List[str]]) -> None:
+    offenders = scan_results[AUTONOMOUS_RETRIES]
     _fail_if(offenders, title="Autonomous retries without policy are forbidden")
 
 
-def test_no_hidden_state_inside_products() -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    offenders = _scan_hidden_product_state(repo_root)
+def test_no_hidden_state_inside_products(scan_results: Dict[str, List[str]]) -> None:
+    offenders = scan_results[HIDDEN_PRODUCT_STATE]
     _fail_if(offenders, title="Hidden mutable state inside products is forbidden")
 
 
-def test_no_self_modifying_flows() -> None:
-    repo_root = Path(__file__).resolve().parents[2]
-    offenders = _scan_self_modifying_flows(repo_root)
+def test_no_self_modifying_flows(scan_results: Dict[str, List[str]]) -> None:
+    offenders = scan_results[SELF_MODIFYING_FLOWS]
     _fail_if(offenders, title="Self-modifying flow files are forbidden")